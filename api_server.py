@@ -0,0 +1,273 @@
+"""Headless HTTP/JSON API over the shared data snapshot.
+
+Serves employee metrics, hierarchy node rollups and rendered charts without
+going through Streamlit::
+
+    python api_server.py --port 8080
+    curl localhost:8080/employees/Tanu%20Jha
+    curl localhost:8080/nodes/RSM/CNF_1/Super_1/Dist_1/Prashant%20Sharma
+    curl localhost:8080/charts/employee/Tanu%20Jha.svg
+
+Routes:
+
+    GET /health
+    GET /employees?prefix=&limit=
+    GET /employees/<name>
+    GET /nodes/<level>/<cnf>/.../<name>     (or /nodes/<level>/<name> when the name is unique)
+    GET /charts/employee/<name>.<svg|png|dot>
+    GET /charts/overall.<svg|png|dot>?detail=lod|full&expand=<level>|<cnf>|...|<name>&...
+"""
+import argparse
+import asyncio
+import json
+import threading
+import traceback
+from collections import OrderedDict
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import graphviz
+
+from data_loader import DATA_PATH, load_snapshot
+from graph_builder import employee_flow_chart, lod_flow_chart, overall_flow_chart
+from hierarchy import LEVELS, get_index, level_label
+from render_cache import get_render_cache
+from summary_image import calculate_target_percentage, target_color
+
+RESPONSE_CACHE_ENTRIES = 1024
+CONTENT_TYPES = {
+    'json': 'application/json',
+    'svg': 'image/svg+xml',
+    'png': 'image/png',
+    'dot': 'text/vnd.graphviz; charset=utf-8',
+}
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error',
+           503: 'Service Unavailable'}
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def node_ref(key):
+    return {'level': level_label(key[0]), 'name': key[1][-1], 'path': list(key[1])}
+
+
+def node_payload(node):
+    return {
+        'level': level_label(node.level),
+        'name': node.name,
+        'path': list(node.path),
+        'sales': float(node.sales),
+        'target': float(node.target),
+        'salary': float(node.salary),
+        'expenses': float(node.expenses),
+        'total_expenses': float(node.total_expenses),
+        'profit': float(node.profit),
+        'rows': int(node.rows),
+    }
+
+
+def employee_payload(index, name):
+    metrics = index.employee_metrics(name)
+    percentage = calculate_target_percentage(metrics['total_sales'], metrics['target'])
+    payload = {key: float(value) for key, value in metrics.items()}
+    payload.update({
+        'employee_name': name,
+        'profit_status': 'Profit' if metrics['profit'] > 0 else 'Loss',
+        'target_percentage': float(percentage),
+        'target_color': target_color(percentage),
+        # One CNF-to-ASM path per distinct placement of the employee's rows
+        'hierarchy': [[{'level': level_label(level), 'name': node_name} for level, node_name in zip(LEVELS, path)]
+                      for path in sorted(set(index.employee_paths(name)[LEVELS[:-1]].itertuples(index=False, name=None)))],
+    })
+    return payload
+
+
+class ApiApp:
+    """Routes requests against the current snapshot, caching JSON responses per snapshot.
+
+    Chart bodies are not kept here; rendered images are cached, with a byte
+    cap, by the render cache.
+    """
+
+    def __init__(self, data_path=DATA_PATH, cache_entries=RESPONSE_CACHE_ENTRIES):
+        self.data_path = data_path
+        self.render_cache = get_render_cache()
+        self.cache_entries = cache_entries
+        self._responses = OrderedDict()
+        self._lock = threading.Lock()
+
+    def handle(self, target):
+        """Return ``(status, content_type, body)`` for a GET of ``target``."""
+        snapshot = load_snapshot(self.data_path)
+        key = (snapshot.digest, target)
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+                return cached
+
+        try:
+            response = (200, *self._route(snapshot, target))
+        except ApiError as error:
+            return error.status, CONTENT_TYPES['json'], json.dumps({'error': str(error)}).encode('utf-8')
+        if response[1] != CONTENT_TYPES['json']:
+            return response
+
+        with self._lock:
+            self._responses[key] = response
+            while len(self._responses) > self.cache_entries:
+                self._responses.popitem(last=False)
+        return response
+
+    def _route(self, snapshot, target):
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.strip('/').split('/') if part]
+        query = parse_qs(url.query)
+        index = get_index(snapshot)
+
+        if parts == ['health']:
+            return self._json({'status': 'ok', 'snapshot': snapshot.digest, 'rows': len(snapshot.data)})
+        if parts == ['employees']:
+            prefix = query.get('prefix', [''])[0].lower()
+            try:
+                limit = int(query.get('limit', ['100'])[0])
+            except ValueError:
+                raise ApiError(400, "limit must be an integer") from None
+            if limit < 0:
+                raise ApiError(400, "limit must not be negative")
+            names = [name for name in snapshot.employee_names if name.lower().startswith(prefix)][:limit]
+            return self._json({'employees': names})
+        if len(parts) == 2 and parts[0] == 'employees':
+            self._require_employee(index, parts[1])
+            return self._json(employee_payload(index, parts[1]))
+        if len(parts) >= 3 and parts[0] == 'nodes':
+            node = index.nodes[self._find_node(index, parts[1], tuple(parts[2:]))]
+            payload = node_payload(node)
+            payload['parent'] = node_ref(node.parent) if node.parent is not None else None
+            payload['children'] = [node_ref(key) for key in sorted(node.children)]
+            return self._json(payload)
+        if len(parts) == 3 and parts[:2] == ['charts', 'employee']:
+            name, fmt = self._split_format(parts[2])
+            self._require_employee(index, name)
+            return self._chart(employee_flow_chart(index, name), fmt)
+        if len(parts) == 2 and parts[0] == 'charts':
+            name, fmt = self._split_format(parts[1])
+            if name != 'overall':
+                raise ApiError(404, f"Unknown chart {name!r}")
+            if query.get('detail', ['lod'])[0] == 'full':
+                return self._chart(overall_flow_chart(index), fmt)
+            expanded = [value.split('|') for value in query.get('expand', []) if '|' in value]
+            expanded = [(path[0], tuple(path[1:])) for path in expanded]
+            return self._chart(lod_flow_chart(index, [key for key in expanded if key in index.nodes]), fmt)
+        raise ApiError(404, f"No route for {url.path}")
+
+    @staticmethod
+    def _json(payload):
+        return CONTENT_TYPES['json'], json.dumps(payload).encode('utf-8')
+
+    @staticmethod
+    def _split_format(part):
+        name, _, fmt = part.rpartition('.')
+        if not name or fmt not in ('svg', 'png', 'dot'):
+            raise ApiError(400, "Charts are served as .svg, .png or .dot")
+        return name, fmt
+
+    @staticmethod
+    def _require_employee(index, name):
+        if not index.has_employee(name):
+            raise ApiError(404, f"Unknown employee {name!r}")
+
+    @staticmethod
+    def _find_node(index, level, path):
+        # Nodes are addressed by their path; a bare name works while only one node at the level has it
+        level = LEVELS[-1] if level == 'Employee' else level
+        if level not in LEVELS:
+            raise ApiError(404, f"Unknown level {level!r}")
+        if (level, path) in index.nodes:
+            return (level, path)
+        if len(path) == 1 and LEVELS.index(level) > 0:
+            matches = [key for key in index.keys(level) if key[1][-1] == path[0]]
+            if len(matches) == 1:
+                return matches[0]
+            if matches:
+                raise ApiError(400, f"{len(matches)} nodes are named {path[0]!r} at {level_label(level)}; "
+                                    f"give the full path, e.g. {'/'.join(matches[0][1])}")
+        raise ApiError(404, f"Unknown node {level_label(level)}/{'/'.join(path)}")
+
+    def _chart(self, source, fmt):
+        if fmt == 'dot':
+            return CONTENT_TYPES['dot'], source.encode('utf-8')
+        try:
+            return CONTENT_TYPES[fmt], self.render_cache.render(source, fmt)
+        except graphviz.ExecutableNotFound:
+            raise ApiError(503, "Graphviz is not installed; request the .dot source instead")
+
+
+async def _handle_connection(app, reader, writer):
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            try:
+                method, target, version = request_line.decode('latin-1').split()
+            except ValueError:
+                method, target, version = '', '/', 'HTTP/1.0'
+            if method == 'GET':
+                # Aggregation and layout run in worker threads so the event loop keeps serving
+                try:
+                    status, content_type, body = await loop.run_in_executor(None, app.handle, target)
+                except Exception:
+                    # Answer instead of dropping the connection; the traceback goes to stderr
+                    traceback.print_exc()
+                    status, content_type, body = 500, CONTENT_TYPES['json'], b'{"error": "Internal server error"}'
+            else:
+                status, content_type, body = 405, CONTENT_TYPES['json'], b'{"error": "Only GET is supported"}'
+
+            keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+            writer.write(
+                f'HTTP/1.1 {status} {REASONS.get(status, "")}\r\n'
+                f'Content-Type: {content_type}\r\n'
+                f'Content-Length: {len(body)}\r\n'
+                f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode('latin-1') + body
+            )
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(app, host='127.0.0.1', port=8080):
+    server = await asyncio.start_server(lambda reader, writer: _handle_connection(app, reader, writer), host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve employee metrics and charts over HTTP.")
+    parser.add_argument('--data', default=DATA_PATH, help="Source CSV (default: %(default)s)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    args = parser.parse_args(argv)
+
+    print(f"Serving {args.data} on http://{args.host}:{args.port}")
+    asyncio.run(serve(ApiApp(args.data), args.host, args.port))
+
+
+if __name__ == '__main__':
+    main()
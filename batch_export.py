@@ -0,0 +1,161 @@
+"""Month-end export of every employee's performance summary image.
+
+Usage::
+
+    python batch_export.py --output summaries.zip
+    python batch_export.py --output summaries.pdf --workers 8
+    python batch_export.py --output summaries.zip --image-format webp --quality 80
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from PIL import Image
+
+from data_loader import DATA_PATH, load_snapshot
+from hierarchy import get_index
+from summary_image import IMAGE_FORMATS, employee_summary, get_renderer
+
+# Pages appended to the PDF per write, which bounds how many images are held at once
+PDF_PAGES_PER_WRITE = 100
+# PDF pages travel from the workers as PNG; light compression is cheap and still far smaller than raw pixels
+PDF_COMPRESS_LEVEL = 1
+
+
+# Workers reuse one renderer per process (fonts, template and output buffer)
+def _render_encoded(renderer_args, job):
+    name, summary_text, percentage, color = job
+    return name, get_renderer(*renderer_args).render_bytes(summary_text, percentage, color)
+
+
+def _decoded(results):
+    for name, data in results:
+        yield name, Image.open(io.BytesIO(data))
+
+
+def pool_context():
+    # Callers run inside the multi-threaded Streamlit server, which is not safe to fork
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def summary_jobs(index):
+    for name in index.employee_names:
+        yield (name, *employee_summary(index, name))
+
+
+def bounded_map(executor, fn, jobs, window):
+    # Like executor.map, but keeps at most ``window`` renders in flight so results stream
+    pending = deque()
+    for job in jobs:
+        pending.append(executor.submit(fn, job))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _safe_filename(name):
+    return ''.join(ch if ch.isalnum() or ch in ' ._-' else '_' for ch in str(name)).strip() or 'employee'
+
+
+def _write_zip(results, output, extension='png'):
+    count = 0
+    seen = set()
+    with zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for name, png in results:
+            filename = _safe_filename(name)
+            if filename in seen:
+                filename = f'{filename}_{count}'
+            seen.add(filename)
+            archive.writestr(f'{filename}.{extension}', png)
+            count += 1
+    return count
+
+
+def write_pdf(results, output, pages_per_write=PDF_PAGES_PER_WRITE):
+    count = 0
+    first = True
+    batch = []
+
+    def flush():
+        nonlocal first
+        head, *rest = batch
+        with open(output, 'wb' if first else 'r+b') as f:
+            head.save(f, format='PDF', save_all=True, append_images=rest, append=not first, resolution=100.0)
+        first = False
+        batch.clear()
+
+    for _, img in results:
+        batch.append(img)
+        count += 1
+        if len(batch) >= pages_per_write:
+            flush()
+    if batch:
+        flush()
+    return count
+
+
+def export_summaries(index, output, fmt=None, workers=None, image_format='png', quality=85):
+    """Render every employee's summary into a ZIP of images or a multi-page PDF.
+
+    ``image_format`` (png, jpeg or webp) and ``quality`` set the encoding of
+    the ZIP entries.
+
+    Returns a dict with the number of images, elapsed seconds and throughput.
+    """
+    fmt = fmt or ('pdf' if str(output).lower().endswith('.pdf') else 'zip')
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    if fmt == 'pdf':
+        renderer_args = ('png', quality, PDF_COMPRESS_LEVEL)
+    elif fmt == 'zip':
+        renderer_args = (image_format, quality)
+    else:
+        raise ValueError(f"Unsupported export format: {fmt!r}")
+
+    # Each worker warms the renderer its jobs use
+    render = partial(_render_encoded, renderer_args)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context(),
+                             initializer=get_renderer, initargs=renderer_args) as executor:
+        results = bounded_map(executor, render, summary_jobs(index), workers * 4)
+        if fmt == 'pdf':
+            count = write_pdf(_decoded(results), output)
+        else:
+            count = _write_zip(results, output, get_renderer(*renderer_args).extension)
+
+    elapsed = time.perf_counter() - start
+    return {
+        'images': count,
+        'seconds': elapsed,
+        'images_per_second': count / elapsed if elapsed > 0 else 0.0,
+        'workers': workers,
+        'format': fmt,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export performance summary images for every employee.")
+    parser.add_argument('--data', default=DATA_PATH, help="Source CSV (default: %(default)s)")
+    parser.add_argument('--output', required=True, help="Output .zip or .pdf file")
+    parser.add_argument('--format', choices=['zip', 'pdf'], help="Output format (default: from the file extension)")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: all cores)")
+    parser.add_argument('--image-format', choices=list(IMAGE_FORMATS), default='png', help="ZIP image format (default: %(default)s)")
+    parser.add_argument('--quality', type=int, default=85, help="JPEG/WebP quality (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    index = get_index(load_snapshot(args.data))
+    stats = export_summaries(index, args.output, args.format, args.workers, args.image_format, args.quality)
+    print(f"Rendered {stats['images']} summaries to {args.output} in {stats['seconds']:.2f}s "
+          f"({stats['images_per_second']:.1f} images/s, {stats['workers']} workers)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""Benchmarks for the load, aggregate, graph build and image render stages.
+
+Generates synthetic org datasets with data.csv's schema and times each
+stage with its peak traced memory, emitting JSON results::
+
+    python bench.py --sizes 1000 10000 100000 --fanout 4 --output bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+from graph_builder import employee_flow_chart, lod_flow_chart, overall_flow_chart
+from hierarchy import HierarchyIndex
+from summary_image import employee_summary, generate_professional_performance_summary_image
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+# Above this many employees the full overall chart is skipped; only the level-of-detail view scales
+FULL_CHART_LIMIT = 100_000
+SAMPLE_EMPLOYEES = 20
+
+
+def make_synthetic_org(employees, fanout=4, seed=0):
+    """Synthetic roster matching data.csv's columns.
+
+    Each level above the employees has ``fanout`` times as many nodes as the
+    one above it (CNF, Super, Distributor, RSM, ASM), capped at the number of
+    employees; employees are spread evenly over the ASMs.
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.arange(employees)
+    level_sizes = [min(employees, fanout ** depth) for depth in range(1, 6)]
+
+    # Walk up from the ASM each employee reports to
+    codes = [ids % level_sizes[-1]]
+    for size, child_size in zip(reversed(level_sizes[:-1]), reversed(level_sizes[1:])):
+        codes.insert(0, codes[0] * size // child_size)
+
+    def names(prefix, values):
+        return prefix + pd.Series(values).astype(str)
+
+    states = np.array(['NORTH INDIA', 'SOUTH INDIA', 'EAST INDIA', 'WEST INDIA', 'CENTRAL INDIA'])
+    state = states[codes[3] % len(states)]
+    return pd.DataFrame({
+        'Employee Name': names('Employee_', ids),
+        'Designation': names('BDE - Territory ', ids % 500),
+        'ASM': names('ASM_', codes[4]),
+        'RSM': names('RSM_', codes[3]),
+        'Distributor': names('Dist_', codes[2]),
+        'Super': names('Super_', codes[1]),
+        'CNF': names('CNF_', codes[0]),
+        'Assigned City': state,
+        'Assigned State': state,
+        'Sales - After Closing': rng.integers(0, 250_000, employees),
+        'Salary': rng.choice([25_000, 30_000, 40_000], employees),
+        'Additional Monthly Expenses': rng.choice([5_000, 7_500], employees),
+        'Target': rng.choice([50_000, 75_000, 100_000], employees),
+    })
+
+
+def measure(fn, *args, trace_memory=True):
+    """Run ``fn``; return its result, elapsed seconds and peak traced memory.
+
+    Tracing slows Python-heavy code considerably, so the timing comes from an
+    untraced run and the memory peak from a second, traced run.
+    """
+    start = time.perf_counter()
+    result = fn(*args)
+    stats = {'seconds': time.perf_counter() - start}
+    if trace_memory:
+        del result
+        tracemalloc.start()
+        try:
+            result = fn(*args)
+            stats['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, stats
+
+
+def _load_cold(path):
+    data_loader._snapshots.clear()
+    shutil.rmtree(os.path.join(os.path.dirname(path), data_loader.SNAPSHOT_DIR), ignore_errors=True)
+    return data_loader.load_snapshot(path)
+
+
+def _load_warm(path):
+    data_loader._snapshots.clear()
+    return data_loader.load_snapshot(path)
+
+
+def _employee_charts(index, names):
+    return [employee_flow_chart(index, name) for name in names]
+
+
+def _summary_images(index, names):
+    return [generate_professional_performance_summary_image(*employee_summary(index, name)) for name in names]
+
+
+def run_size(employees, fanout, seed=0, trace_memory=True):
+    stages = {}
+
+    def timed(name, fn, *args):
+        result, stages[name] = measure(fn, *args, trace_memory=trace_memory)
+        return result
+
+    data = make_synthetic_org(employees, fanout, seed)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'data.csv')
+        data.to_csv(path, index=False)
+        del data
+
+        # Cold load parses the CSV and writes the columnar snapshot; warm load reads that snapshot
+        timed('load_cold', _load_cold, path)
+        snapshot = timed('load_warm', _load_warm, path)
+
+        index = timed('aggregate', HierarchyIndex, snapshot.data)
+        sample = snapshot.employee_names[:SAMPLE_EMPLOYEES]
+
+        timed('employee_lookup', lambda: [snapshot.employee_rows(name) for name in sample])
+        timed('graph_employee', _employee_charts, index, sample)
+        timed('graph_lod', lod_flow_chart, index)
+        if employees <= FULL_CHART_LIMIT:
+            source = timed('graph_overall', overall_flow_chart, index)
+            stages['graph_overall']['dot_bytes'] = len(source)
+        timed('render_summary_images', _summary_images, index, sample)
+
+        data_loader._snapshots.clear()
+
+    for name in ('employee_lookup', 'graph_employee', 'render_summary_images'):
+        stages[name]['items'] = len(sample)
+    return {'employees': employees, 'fanout': fanout, 'stages': stages}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the data, aggregation, graph and image stages.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Employee counts to benchmark")
+    parser.add_argument('--fanout', type=int, default=4, help="Children per node above the employees (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help="Skip the traced runs that measure peak memory")
+    parser.add_argument('--output', help="Write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'runs': [run_size(size, args.fanout, args.seed, not args.no_memory) for size in args.sizes],
+    }
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Process-wide compute core shared by every page and session of the Streamlit app.
+
+The data snapshot, rollup index, search engine, performance matrix, trends
+and render cache each live once per process and are rebuilt only when the
+data changes, so pages never hold their own copies and each page reuses
+the work the others have already done.
+"""
+from dataclasses import dataclass
+
+import graphviz
+
+from data_loader import DATA_PATH, load_snapshot
+from hierarchy import get_index
+from memo import LatestCache
+from performance import get_performance_matrix
+from render_cache import get_render_cache
+from search import get_search_engine
+from timeseries import get_trends
+
+_cores = LatestCache()
+
+
+@dataclass(frozen=True)
+class Core:
+    snapshot: object
+    index: object
+    search: object
+    render_cache: object
+
+    @property
+    def data(self):
+        # Shared between pages and sessions, so treat it as read-only
+        return self.snapshot.data
+
+    @property
+    def matrix(self):
+        return get_performance_matrix(self.snapshot)
+
+    @property
+    def trends(self):
+        return get_trends()
+
+
+def get_core(path=DATA_PATH):
+    """Compute core for the current version of ``path``; a stat call when nothing changed."""
+    snapshot = load_snapshot(path)
+    return _cores.get(snapshot.path, snapshot.digest,
+                      lambda previous: Core(snapshot, get_index(snapshot), get_search_engine(snapshot), get_render_cache()))
+
+
+def show_chart(dot, render_cache=None):
+    """Render DOT source server-side through the shared render cache and display it."""
+    import streamlit as st
+
+    render_cache = render_cache or get_render_cache()
+    try:
+        svg = render_cache.render(dot, 'svg')
+    except graphviz.ExecutableNotFound:
+        # No local Graphviz install: fall back to browser-side layout
+        st.graphviz_chart(dot)
+        return
+    st.image(svg.decode('utf-8'), width='stretch')
@@ -0,0 +1,231 @@
+import hashlib
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+import perf
+
+DATA_PATH = 'data.csv'
+SNAPSHOT_DIR = '.snapshot_cache'
+
+# Process-wide cache of parsed snapshots, keyed by the absolute source path
+_snapshots = {}
+_lock = threading.Lock()
+
+
+# Columns identifying a row across file revisions
+ROW_KEY_COLUMNS = ['Employee Name', 'Designation']
+DERIVED_COLUMNS = ['Total Expenses', 'Profit', 'Profit Status']
+
+# Repetitive hierarchy/location columns stored as categoricals over one shared dictionary
+CATEGORICAL_COLUMNS = ['CNF', 'Super', 'Distributor', 'RSM', 'ASM', 'Designation', 'Assigned City', 'Assigned State']
+
+
+@dataclass
+class SnapshotDelta:
+    previous_digest: str
+    # Previous version of every changed or deleted row
+    removed: pd.DataFrame
+    # New version of every changed or inserted row
+    added: pd.DataFrame
+
+
+@dataclass
+class Snapshot:
+    path: str
+    signature: tuple
+    digest: str
+    data: pd.DataFrame
+    row_hashes: pd.Series = None
+    delta: SnapshotDelta = None
+    _employee_positions: dict = field(default=None, repr=False)
+
+    @property
+    def employee_positions(self):
+        # Employee name -> row positions, built once per snapshot
+        if self._employee_positions is None:
+            self._employee_positions = self.data.groupby('Employee Name', sort=False, observed=True).indices
+        return self._employee_positions
+
+    @property
+    def employee_names(self):
+        return list(self.employee_positions)
+
+    def employee_rows(self, name):
+        # O(1) replacement for data[data['Employee Name'] == name]
+        return self.data.iloc[self.employee_positions[name]]
+
+
+def file_signature(path):
+    # Cheap change detection: modification time and size of the source file
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def file_digest(path, block_size=1 << 20):
+    sha = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def add_derived_columns(data):
+    # Calculate expenses, profit, and profit status
+    data['Total Expenses'] = data['Salary'] + data['Additional Monthly Expenses']
+    data['Profit'] = data['Sales - After Closing'] - data['Total Expenses']
+    data['Profit Status'] = np.where(data['Profit'] > 0, 'Profit', 'Loss')
+    return data
+
+
+def _category_strings(values):
+    # Numeric codes become their string form, like the categories; missing values stay missing
+    if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+        # Whole numbers read as floats because of a gap: 1.0 -> '1'
+        values = values.astype('Int64')
+    return values.astype(str).where(values.notna())
+
+
+def encode_categoricals(data):
+    """Convert the hierarchy and location columns to categoricals sharing one dictionary.
+
+    Equal strings get the same integer code in every column, so e.g. ``Nil``
+    is stored once whether it appears as an RSM or an ASM.
+    """
+    columns = [column for column in CATEGORICAL_COLUMNS if column in data.columns]
+    if not columns:
+        return data
+    as_strings = {column: _category_strings(data[column]) for column in columns}
+    values = pd.concat(as_strings.values(), ignore_index=True).dropna().unique()
+    dtype = pd.CategoricalDtype(sorted(values))
+    for column, strings in as_strings.items():
+        data[column] = strings.astype(dtype)
+    return data
+
+
+def read_source(path):
+    # Source tables are CSV, or Parquet as written by ingest.py
+    with perf.stage('read_source'):
+        data = pd.read_parquet(path) if path.lower().endswith('.parquet') else pd.read_csv(path)
+    perf.count('rows_read', len(data))
+    return data
+
+
+def row_hashes(data):
+    """Content hash of every row's source columns, indexed by its row key.
+
+    Repeated keys are told apart by their occurrence number.
+    """
+    source_columns = [column for column in data.columns if column not in DERIVED_COLUMNS]
+    hashes = pd.Series(pd.util.hash_pandas_object(data[source_columns], index=False).to_numpy())
+    occurrence = data.groupby(ROW_KEY_COLUMNS, sort=False, observed=True).cumcount()
+    key_values = [data[column].astype(str).to_numpy() for column in ROW_KEY_COLUMNS] + [occurrence.to_numpy()]
+    hashes.index = pd.MultiIndex.from_arrays(key_values, names=ROW_KEY_COLUMNS + ['occurrence'])
+    return hashes
+
+
+def _incremental_update(raw, previous):
+    # Derived columns are carried over for unchanged rows and only computed for the delta
+    hashes = row_hashes(raw)
+    old_hashes = previous.row_hashes
+    old_positions = pd.Series(np.arange(len(old_hashes)), index=old_hashes.index)
+
+    matched = old_positions.reindex(hashes.index)
+    unchanged = matched.notna().to_numpy() & (old_hashes.reindex(hashes.index).to_numpy() == hashes.to_numpy())
+    kept = hashes.index[unchanged]
+    changed_old = ~old_hashes.index.isin(kept)
+
+    data = raw
+    for column in DERIVED_COLUMNS:
+        data[column] = previous.data[column].iloc[matched.fillna(0).astype(int).to_numpy()].to_numpy()
+    if not unchanged.all():
+        data.loc[~unchanged, DERIVED_COLUMNS] = add_derived_columns(raw.loc[~unchanged].copy())[DERIVED_COLUMNS]
+
+    delta = SnapshotDelta(
+        previous_digest=previous.digest,
+        removed=previous.data.iloc[np.flatnonzero(changed_old)],
+        added=data.loc[~unchanged],
+    )
+    return data, hashes, delta
+
+
+def _read_columnar(snapshot_path):
+    try:
+        return pd.read_parquet(snapshot_path)
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def _snapshot_path(path, digest):
+    return os.path.join(os.path.dirname(path), SNAPSHOT_DIR, f'{os.path.basename(path)}.{digest}.parquet')
+
+
+def _write_columnar(data, path, digest):
+    # The on-disk tier is best effort; without pyarrow we only keep the in-memory copy
+    snapshot_path = _snapshot_path(path, digest)
+    try:
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        tmp_path = snapshot_path + '.tmp'
+        data.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, snapshot_path)
+    except (ImportError, OSError, ValueError):
+        return
+    _prune_columnar(path, digest)
+
+
+def _prune_columnar(path, digest):
+    # Only the current revision of each source is kept on disk
+    directory = os.path.join(os.path.dirname(path), SNAPSHOT_DIR)
+    stale = re.compile(re.escape(os.path.basename(path)) + r'\.(?!' + digest + r'\.)[0-9a-f]{40}\.parquet(\.tmp)?')
+    for name in os.listdir(directory):
+        if stale.fullmatch(name):
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+
+
+@perf.timed('build_snapshot')
+def _build_snapshot(path, signature, previous=None):
+    digest = file_digest(path)
+    if previous is not None and previous.digest == digest:
+        # Touched but not modified
+        return Snapshot(path=path, signature=signature, digest=digest, data=previous.data, row_hashes=previous.row_hashes)
+
+    if previous is not None:
+        # Hashes and the delta are taken on the encoded values, as on a cold load
+        data, hashes, delta = _incremental_update(encode_categoricals(read_source(path)), previous)
+        _write_columnar(data, path, digest)
+        return Snapshot(path=path, signature=signature, digest=digest, data=data, row_hashes=hashes, delta=delta)
+
+    snapshot_path = _snapshot_path(path, digest)
+    with perf.stage('read_columnar'):
+        data = _read_columnar(snapshot_path) if os.path.exists(snapshot_path) else None
+    if data is None:
+        data = encode_categoricals(add_derived_columns(read_source(path)))
+        _write_columnar(data, path, digest)
+
+    return Snapshot(path=path, signature=signature, digest=digest, data=data, row_hashes=row_hashes(data))
+
+
+def load_snapshot(path=DATA_PATH):
+    """Return the cached snapshot for ``path``, re-parsing only when the file changed.
+
+    When a previous snapshot of the same file is cached, the new one records
+    which rows changed (``Snapshot.delta``) so downstream indexes can update
+    incrementally instead of rebuilding.
+    """
+    path = os.path.abspath(path)
+    signature = file_signature(path)
+
+    with _lock:
+        snapshot = _snapshots.get(path)
+        if snapshot is None or snapshot.signature != signature:
+            snapshot = _build_snapshot(path, signature, snapshot)
+            _snapshots[path] = snapshot
+    return snapshot
+
@@ -0,0 +1,165 @@
+"""Export of the overall org chart, laid out one partition at a time in parallel.
+
+The hierarchy is split into independent CNF (or Super) subtrees, each one is
+laid out by Graphviz in a worker process, and the results are stitched into
+a single SVG or a multi-page PDF with an index page::
+
+    python export_chart.py --output org_chart.svg
+    python export_chart.py --output org_chart.pdf --level Super --workers 8
+"""
+import argparse
+import io
+import math
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+from PIL import Image, ImageDraw
+
+from batch_export import bounded_map, pool_context, write_pdf
+from data_loader import DATA_PATH, load_snapshot
+from graph_builder import subtree_flow_chart
+from hierarchy import LEVELS, get_index, level_label
+from render_cache import get_render_cache
+from summary_image import load_fonts
+
+# PDF pages are rasterized, so each partition is scaled down to fit this many inches at PDF_DPI
+PDF_PAGE_SIZE = '30,30'
+PDF_DPI = 96
+# A rasterized partition can reach tens of megabytes, so pages are written to the PDF one at a time
+PDF_PAGES_PER_WRITE = 1
+INDEX_PAGE_SIZE = (850, 1100)
+INDEX_LINES_PER_PAGE = 40
+
+_SVG_TAG = re.compile(r'<svg\b[^>]*>', re.S)
+_SVG_ATTR = re.compile(r'\b(width|height|viewBox)="([^"]*)"')
+
+
+def partitions(index, level='CNF'):
+    """Keys of the partition roots at ``level``, largest sales first.
+
+    Each partition is drawn from the path rows under its root only.
+    """
+    return sorted(index.keys(level), key=lambda key: -index.nodes[key].sales)
+
+
+def _layout(job):
+    # Runs in a worker process, each with its own render cache (sharing the disk tier if configured)
+    key, source, fmt = job
+    return key, get_render_cache().render(source, fmt)
+
+
+def layout_partitions(index, level='CNF', fmt='svg', workers=None, size=None, dpi=None):
+    """Yield ``(root key, rendered bytes)`` per partition, in ``partitions`` order."""
+    workers = workers or os.cpu_count() or 1
+    jobs = ((key, subtree_flow_chart(index, key, size=size, dpi=dpi), fmt) for key in partitions(index, level))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as executor:
+        yield from bounded_map(executor, _layout, jobs, workers * 2)
+
+
+def _points(value):
+    return float(re.sub(r'[a-z]+$', '', value))
+
+
+def stitch_svgs(svgs, columns=None, gap=36.0):
+    """Place rendered SVG documents on a grid inside one SVG document.
+
+    Each part becomes a nested ``<svg>`` positioned in points; element IDs
+    are prefixed per part so they stay unique.
+    """
+    parts = []
+    for number, svg in enumerate(svgs):
+        text = svg.decode('utf-8') if isinstance(svg, bytes) else svg
+        tag = _SVG_TAG.search(text)
+        attrs = dict(_SVG_ATTR.findall(tag.group(0)))
+        width, height = _points(attrs['width']), _points(attrs['height'])
+        body = text[tag.end():text.rindex('</svg>')]
+        body = body.replace(' id="', f' id="p{number}_').replace('url(#', f'url(#p{number}_')
+        parts.append((width, height, attrs.get('viewBox', f'0 0 {width} {height}'), body))
+
+    columns = columns or max(1, math.ceil(math.sqrt(len(parts))))
+    placed = []
+    total_width = y = 0.0
+    for row_start in range(0, len(parts), columns):
+        row = parts[row_start:row_start + columns]
+        x = 0.0
+        for width, height, view_box, body in row:
+            placed.append(f'<svg x="{x:.2f}" y="{y:.2f}" width="{width:.2f}" height="{height:.2f}" '
+                          f'viewBox="{view_box}">{body}</svg>')
+            x += width + gap
+        total_width = max(total_width, x - gap)
+        y += max(height for _, height, _, _ in row) + gap
+    total_height = max(0.0, y - gap)
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n'
+        f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'width="{total_width:.2f}pt" height="{total_height:.2f}pt" viewBox="0 0 {total_width:.2f} {total_height:.2f}">\n'
+        + '\n'.join(placed) + '\n</svg>\n'
+    )
+
+
+def index_pages(index, keys):
+    """Pillow pages listing each partition with its page number, sales and employee count."""
+    font_header, font_body, _ = load_fonts()
+    page_count = math.ceil(len(keys) / INDEX_LINES_PER_PAGE) or 1
+    for page in range(page_count):
+        img = Image.new('RGB', INDEX_PAGE_SIZE, color='white')
+        draw = ImageDraw.Draw(img)
+        draw.text((40, 40), "Sales Flow Chart - Index", font=font_header, fill="#007bff")
+        for line, key in enumerate(keys[page * INDEX_LINES_PER_PAGE:(page + 1) * INDEX_LINES_PER_PAGE]):
+            number = page * INDEX_LINES_PER_PAGE + line
+            node = index.nodes[key]
+            employees = index.subtree_paths(key)[LEVELS[-1]].nunique()
+            draw.text((40, 90 + line * 24),
+                      f"Page {page_count + number + 1}: {level_label(key[0])} {node.name} - "
+                      f"Sales: Rs {node.sales:,.2f} - {employees} employees",
+                      font=font_body, fill="black")
+        yield key, img
+
+
+def export_chart(index, output, fmt=None, level='CNF', workers=None):
+    """Write the overall chart as one stitched SVG or a multi-page PDF.
+
+    Returns a dict with the number of partitions, elapsed seconds and workers.
+    """
+    fmt = fmt or ('pdf' if str(output).lower().endswith('.pdf') else 'svg')
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    if fmt == 'svg':
+        svgs = [svg for _, svg in layout_partitions(index, level, 'svg', workers)]
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(stitch_svgs(svgs))
+        count = len(svgs)
+    elif fmt == 'pdf':
+        keys = partitions(index, level)
+        pages = ((key, Image.open(io.BytesIO(png)).convert('RGB'))
+                 for key, png in layout_partitions(index, level, 'png', workers, PDF_PAGE_SIZE, PDF_DPI))
+        write_pdf(chain(index_pages(index, keys), pages), output, PDF_PAGES_PER_WRITE)
+        count = len(keys)
+    else:
+        raise ValueError(f"Unsupported export format: {fmt!r}")
+
+    return {'partitions': count, 'seconds': time.perf_counter() - start, 'workers': workers, 'format': fmt}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the overall sales flow chart, laid out in parallel per partition.")
+    parser.add_argument('--data', default=DATA_PATH, help="Source CSV (default: %(default)s)")
+    parser.add_argument('--output', required=True, help="Output .svg or .pdf file")
+    parser.add_argument('--format', choices=['svg', 'pdf'], help="Output format (default: from the file extension)")
+    parser.add_argument('--level', choices=['CNF', 'Super'], default='CNF', help="Partition level (default: %(default)s)")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    index = get_index(load_snapshot(args.data))
+    stats = export_chart(index, args.output, args.format, args.level, args.workers)
+    print(f"Laid out {stats['partitions']} partitions into {args.output} in {stats['seconds']:.2f}s "
+          f"({stats['workers']} workers)")
+
+
+if __name__ == '__main__':
+    main()
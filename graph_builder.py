@@ -0,0 +1,306 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+import perf
+from hierarchy import LEVELS, hierarchy_links, level_label, level_rollups
+from timeseries import format_trend
+
+DEFAULT_NODE_STYLE = {'shape': 'box', 'style': 'filled', 'fontname': 'Helvetica'}
+
+# Node colors for each hierarchy level
+LEVEL_COLORS = [
+    ('CNF', 'lightblue'),
+    ('Super', 'lightyellow'),
+    ('Distributor', 'lavender'),
+    ('RSM', 'lightcoral'),
+    ('ASM', 'lightpink')
+]
+
+
+def quote(values):
+    # Quote a Series of strings as DOT IDs
+    values = values.astype(str).str.replace('\\', '\\\\', regex=False).str.replace('"', '\\"', regex=False)
+    values = values.str.replace('\n', '\\n', regex=False)
+    return '"' + values + '"'
+
+
+def dot_quote(text):
+    # Scalar counterpart of ``quote``, for charts small enough to format line by line
+    text = str(text).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return f'"{text}"'
+
+
+def dot_id(level, path):
+    return dot_quote(level + '|' + '|'.join(map(str, path)))
+
+
+def format_attrs(attrs):
+    return ', '.join(f'{key}="{value}"' for key, value in attrs.items())
+
+
+def node_attrs(color=None, style=None):
+    # Attribute list appended after a node's label, e.g. ', shape="box", color="lightblue"'
+    attrs = dict(DEFAULT_NODE_STYLE if style is None else style)
+    if color is not None:
+        attrs['color'] = color
+    return ', ' + format_attrs(attrs) if attrs else ''
+
+
+def node_id(level, paths):
+    # Node IDs are the level and the node's full path, so "Nil" under two RSMs stays two nodes
+    return quote(level + '|' + pd.Series(['|'.join(map(str, path)) for path in paths], dtype=object))
+
+
+def format_amounts(values):
+    return pd.Series(values, dtype=float).map('₹{:,.2f}'.format)
+
+
+def node_lines(level, paths, labels, color=None, style=None):
+    ids = node_id(level, paths)
+    perf.count('dot_nodes', len(ids))
+    labels = quote(pd.Series(labels, dtype=object).reset_index(drop=True))
+    return ids + ' [label=' + labels + node_attrs(color, style) + '];'
+
+
+def level_node_lines(level, sales, color=None, style=None, notes=None):
+    """DOT node statements for one hierarchy level, given a Series of sales indexed by node path.
+
+    ``notes`` optionally adds a line (e.g. a trend) under each node's sales.
+    """
+    paths = list(sales.index)
+    names = pd.Series([path[-1] for path in paths], dtype=object).astype(str)
+    labels = f'{level_label(level)}: ' + names + '\n' + 'Sales: ' + format_amounts(sales.to_numpy())
+    if notes is not None:
+        notes = pd.Series(notes, dtype=object).fillna('').astype(str).reset_index(drop=True)
+        labels = labels + notes.where(notes == '', '\n' + notes)
+    return node_lines(level, paths, labels, color, style)
+
+
+def edge_lines(edges, max_penwidth=5.0):
+    # Edge weight follows the employee count, pen width the share of sales volume
+    if edges.empty:
+        return pd.Series([], dtype=object)
+    perf.count('dot_edges', len(edges))
+    sales = edges['sales'].to_numpy(dtype=float)
+    peak = sales.max()
+    penwidth = 1.0 + (max_penwidth - 1.0) * (sales / peak if peak > 0 else np.zeros_like(sales))
+    sources = node_id(edges['source_level'].to_numpy(), edges['source'])
+    targets = node_id(edges['target_level'].to_numpy(), edges['target'])
+    tooltips = edges['employees'].astype(str) + ' employees, ' + format_amounts(sales)
+    return (
+        sources + ' -> ' + targets
+        + ' [weight=' + edges['employees'].astype(str)
+        + ', penwidth=' + pd.Series(penwidth).map('{:.2f}'.format)
+        + ', tooltip=' + quote(tooltips) + '];'
+    )
+
+
+def dot_source(statements, rankdir='TB', size='12,10', dpi=None):
+    """Join node/edge statement Series into a complete DOT digraph in one pass.
+
+    ``size=None`` leaves the layout at its natural size instead of scaling it down.
+    """
+    body = [f'\trankdir={rankdir}']
+    if size:
+        body.append(f'\tsize="{size}"')
+    if dpi:
+        body.append(f'\tdpi={dpi}')
+    for lines in statements:
+        body.append('\t' + '\n\t'.join(lines))
+    return 'digraph {\n' + '\n'.join(body) + '\n}\n'
+
+
+@perf.timed('dot_employee_chart')
+def employee_flow_chart(index, emp_name, level_colors=LEVEL_COLORS, employee_color='lightblue', trends=None,
+                        style=None, size='12,10', show_target=True, max_penwidth=5.0):
+    """DOT source for one employee's path through the hierarchy.
+
+    With a ``timeseries.TrendIndex``, each node also shows its latest trend.
+    ``employee_color`` may be a callable taking the profit, for profit/loss coloring.
+    The chart has a handful of nodes, so it is formatted line by line; the
+    output matches the vectorized builders'.
+    """
+    metrics = index.employee_metrics(emp_name)
+    leaves = sorted(index.employee_leaves(emp_name), key=lambda leaf: leaf.path)
+
+    # Employee's sales under each node on their paths, and the links between those nodes
+    node_sales = {}
+    links = {}
+    for leaf in leaves:
+        keys = [(level, leaf.path[:depth + 1]) for depth, level in enumerate(LEVELS)]
+        for key in keys[:-1]:
+            node_sales[key] = node_sales.get(key, 0) + leaf.sales
+        for link in zip(keys, keys[1:]):
+            totals = links.setdefault(link, [0, 0])
+            totals[0] += 1
+            totals[1] += leaf.sales
+
+    # Add CNF, Super, Distributor, RSM, and ASM sales nodes
+    statements = []
+    for level, color in level_colors:
+        attrs = node_attrs(color, style)
+        lines = []
+        for (node_level, path), sales in node_sales.items():
+            if node_level != level:
+                continue
+            label = f'{level_label(level)}: {path[-1]}\nSales: ₹{sales:,.2f}'
+            if trends is not None:
+                # Level nodes show the employee's share of sales, but the trend is the node's total
+                note = format_trend(trends.latest(level, path))
+                if note:
+                    label += f'\nNode trend: {note}'
+            lines.append(f'{dot_id(level, path)} [label={dot_quote(label)}{attrs}];')
+        statements.append(lines)
+
+    # Add employee node with details, one per path the employee's rows fall under
+    label = f'Employee: {emp_name}\nTotal Sales: ₹{metrics["total_sales"]:,.2f}'
+    if show_target:
+        label += f'\nTarget: ₹{metrics["target"]:,.2f}'
+    label += (f'\nSalary: ₹{metrics["average_salary"]:,.2f}\nTotal Expenses: ₹{metrics["total_expenses"]:,.2f}'
+              f'\nProfit: ₹{metrics["profit"]:,.2f}')
+    if trends is not None and trends.latest('Employee Name', emp_name):
+        label += '\n' + format_trend(trends.latest('Employee Name', emp_name))
+    if callable(employee_color):
+        employee_color = employee_color(metrics['profit'])
+    attrs = node_attrs(employee_color, style)
+    statements.append([f'{dot_id(LEVELS[-1], leaf.path)} [label={dot_quote(label)}{attrs}];' for leaf in leaves])
+    perf.count('dot_nodes', len(node_sales) + len(leaves))
+
+    # Hierarchical edges, one per distinct link, weighted like ``edge_lines``
+    peak = max((sales for _, sales in links.values()), default=0)
+    lines = []
+    for (source, target), (employees, sales) in links.items():
+        penwidth = 1.0 + (max_penwidth - 1.0) * (sales / peak if peak > 0 else 0.0)
+        tooltip = f'{employees} employees, ₹{sales:,.2f}'
+        lines.append(f'{dot_id(*source)} -> {dot_id(*target)} [weight={employees}, penwidth={penwidth:.2f}, '
+                     f'tooltip={dot_quote(tooltip)}];')
+    statements.append(lines)
+    perf.count('dot_edges', len(lines))
+
+    return dot_source(statements, size=size)
+
+
+@perf.timed('dot_overall_chart')
+def overall_flow_chart(index, level_colors=LEVEL_COLORS):
+    """DOT source for the whole hierarchy, every node and link included."""
+    # Add CNF, Super, Distributor, RSM, and ASM sales nodes from the rollup index
+    statements = [level_node_lines(level, index.level_totals[level]['sales'], color) for level, color in level_colors]
+
+    # Employee leaves keep their plain name
+    employees = list(index.level_totals['Employee Name'].index)
+    statements.append(node_lines('Employee Name', employees, [path[-1] for path in employees], style={}))
+
+    # Hierarchical edges, deduplicated and weighted by employee count and sales
+    statements.append(edge_lines(index.links))
+
+    return dot_source(statements)
+
+
+@perf.timed('dot_subtree_chart')
+def subtree_flow_chart(index, root, level_colors=LEVEL_COLORS, size=None, dpi=None):
+    """DOT source for ``root`` and everything below it, styled like the overall chart.
+
+    Built only from the path rows under ``root``, so partitions of the
+    hierarchy are independent and can be laid out separately.
+    """
+    return paths_flow_chart(index.subtree_paths(root), level_colors, root[0], size, dpi)
+
+
+def paths_flow_chart(paths, level_colors=LEVEL_COLORS, top=LEVELS[0], size=None, dpi=None):
+    """DOT source for the nodes and links on a table of path rows (see ``hierarchy.path_metrics``).
+
+    Levels above ``top`` are left out.
+    """
+    levels = LEVELS[LEVELS.index(top):]
+    rollups = level_rollups(paths, levels)
+    statements = []
+    for level, color in level_colors:
+        if level in levels:
+            statements.append(level_node_lines(level, rollups[level]['sales'], color))
+
+    employees = list(rollups[LEVELS[-1]].index)
+    statements.append(node_lines('Employee Name', employees, [path[-1] for path in employees], style={}))
+
+    statements.append(edge_lines(hierarchy_links(rollups, levels)))
+
+    return dot_source(statements, size=size, dpi=dpi)
+
+
+@perf.timed('dot_lod_chart')
+def lod_flow_chart(index, expanded=(), level_colors=LEVEL_COLORS, max_children=25, max_nodes=200):
+    """DOT source for a level-of-detail view of the overall hierarchy.
+
+    CNF nodes are always open; any other node only shows its children when
+    its key is in ``expanded``. The CNFs and the children of each open node
+    are capped at ``max_children`` (highest sales first) and the render stops
+    adding nodes at ``max_nodes``; whatever is left out is folded into an
+    "N more…" node, so only a bounded subgraph is ever laid out.
+    """
+    level_colors = dict(level_colors)
+    roots = sorted(index.keys(LEVELS[0]), key=lambda root: -index.nodes[root].sales)
+    room = min(max_children, max_nodes)
+    roots, hidden_roots = roots[:room], roots[room:]
+    open_keys = set(expanded) | set(roots)
+
+    visible = list(roots)
+    seen = set(roots)
+    links = []
+    # CNFs left out are summarized at the top level, without a parent
+    summaries = [(None, hidden_roots)] if hidden_roots else []
+    queue = deque(roots)
+    while queue:
+        key = queue.popleft()
+        if key not in open_keys:
+            continue
+        children = sorted(index.nodes[key].children, key=lambda child: -index.nodes[child].sales)
+        room = max(0, min(max_children, max_nodes - len(visible)))
+        for child in children[:room]:
+            links.append((key, child))
+            if child not in seen:
+                seen.add(child)
+                visible.append(child)
+                queue.append(child)
+        hidden = children[room:]
+        if hidden:
+            summaries.append((key, hidden))
+
+    statements = []
+    for level in LEVELS:
+        keys = [key for key in visible if key[0] == level]
+        if not keys:
+            continue
+        paths = [path for _, path in keys]
+        labels = []
+        for key in keys:
+            node = index.nodes[key]
+            label = f'{level_label(level)}: {node.name}\nSales: ₹{node.sales:,.2f}'
+            if node.children and key not in open_keys:
+                label += f'\n▸ {len(node.children)} below'
+            labels.append(label)
+        statements.append(node_lines(level, paths, labels, level_colors.get(level)))
+
+    # Summary nodes for children left out of this render
+    summary_links = []
+    for parent, hidden in summaries:
+        level = hidden[0][0]
+        hidden_sales = sum(index.nodes[child].sales for child in hidden)
+        hidden_employees = sum(index.nodes[child].employees for child in hidden)
+        summary_path = (parent[1] if parent else ()) + ('more…',)
+        style = dict(DEFAULT_NODE_STYLE, style='dashed')
+        statements.append(node_lines(level, [summary_path], [f'{len(hidden)} more…\nSales: ₹{hidden_sales:,.2f}'], style=style))
+        if parent:
+            summary_links.append((parent, (level, summary_path), hidden_employees, hidden_sales))
+
+    # A link carries its child's totals; a summary link those of the children it stands for
+    edges = pd.DataFrame(
+        [(parent[0], parent[1], child[0], child[1], index.nodes[child].employees, index.nodes[child].sales)
+         for parent, child in links]
+        + [(parent[0], parent[1], child[0], child[1], employees, sales)
+           for parent, child, employees, sales in summary_links],
+        columns=['source_level', 'source', 'target_level', 'target', 'employees', 'sales'],
+    )
+    statements.append(edge_lines(edges))
+
+    return dot_source(statements)
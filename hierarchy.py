@@ -0,0 +1,362 @@
+import pandas as pd
+
+import perf
+from memo import LatestCache
+
+# Sales hierarchy from the top of the chain down to the individual employee
+LEVELS = ['CNF', 'Super', 'Distributor', 'RSM', 'ASM', 'Employee Name']
+LEVEL_LABELS = {'Employee Name': 'Employee'}
+
+# Rolled-up node metrics and the data columns they are summed from
+METRIC_COLUMNS = {
+    'sales': 'Sales - After Closing',
+    'target': 'Target',
+    'salary': 'Salary',
+    'expenses': 'Additional Monthly Expenses',
+    'total_expenses': 'Total Expenses',
+    'profit': 'Profit',
+}
+
+
+def level_label(level):
+    return LEVEL_LABELS.get(level, level)
+
+
+def level_rollups(paths, levels=LEVELS):
+    """Summed metrics per node at each level, indexed by the node's path from the CNF down.
+
+    ``paths`` has one row per employee path (see ``path_metrics``), so the
+    ``employees`` count of a node is the number of path rows under it.
+    """
+    rollups = {}
+    for level in levels:
+        grouped = paths.groupby(LEVELS[:LEVELS.index(level) + 1], sort=False, observed=True)
+        totals = grouped[PATH_METRICS].sum()
+        totals['employees'] = grouped.size()
+        if not isinstance(totals.index, pd.MultiIndex):
+            totals.index = pd.MultiIndex.from_arrays([totals.index])
+        rollups[level] = totals
+    return rollups
+
+
+def hierarchy_links(rollups, levels=LEVELS):
+    """Parent/child links between adjacent levels with employee count and sales volume.
+
+    Every node has exactly one parent (the prefix of its path), so a link
+    carries the totals of its child node.
+    """
+    parts = []
+    for parent, child in zip(levels, levels[1:]):
+        totals = rollups[child]
+        targets = list(totals.index)
+        parts.append(pd.DataFrame({
+            'source_level': parent,
+            'source': pd.Series([path[:-1] for path in targets], dtype=object),
+            'target_level': child,
+            'target': pd.Series(targets, dtype=object),
+            'employees': totals['employees'].to_numpy(),
+            'sales': totals['sales'].to_numpy(),
+        }))
+    return pd.concat(parts, ignore_index=True)
+
+
+def ancestor_keys(key):
+    # A tree node's ancestors are the prefixes of its path
+    level, path = key
+    return [(LEVELS[depth], path[:depth + 1]) for depth in range(LEVELS.index(level))]
+
+
+class _Closure:
+    """Memoized transitive children of each node, looked up like a dict."""
+
+    def __init__(self, nodes, attribute):
+        self._nodes = nodes
+        self._attribute = attribute
+        self._memo = {}
+
+    def __getitem__(self, key):
+        found = self._memo.get(key)
+        if found is None:
+            found = set()
+            for neighbour in getattr(self._nodes[key], self._attribute):
+                found.add(neighbour)
+                found |= self[neighbour]
+            found = self._memo[key] = frozenset(found)
+        return found
+
+    def __contains__(self, key):
+        return key in self._nodes
+
+    def clear(self):
+        self._memo.clear()
+
+
+class HierarchyNode:
+    __slots__ = ('level', 'path', 'parent', 'children', 'rows', 'employees', *METRIC_COLUMNS)
+
+    def __init__(self, level, path):
+        self.level = level
+        self.path = path
+        self.parent = ancestor_keys((level, path))[-1] if len(path) > 1 else None
+        self.children = set()
+        self.rows = 0
+        self.employees = 0
+        for metric in METRIC_COLUMNS:
+            setattr(self, metric, 0.0)
+
+    @property
+    def key(self):
+        return (self.level, self.path)
+
+    @property
+    def name(self):
+        return self.path[-1]
+
+    @property
+    def average_salary(self):
+        return self.salary / self.rows if self.rows else 0.0
+
+    @property
+    def average_target(self):
+        return self.target / self.rows if self.rows else 0.0
+
+    def copy(self):
+        node = object.__new__(HierarchyNode)
+        for slot in self.__slots__:
+            setattr(node, slot, getattr(self, slot))
+        node.children = set(self.children)
+        return node
+
+    def __repr__(self):
+        return f'HierarchyNode({self.level!r}, {self.path!r}, sales={self.sales:,.2f})'
+
+
+# Per-path metric vector: the rolled-up metrics plus the number of source rows
+PATH_METRICS = list(METRIC_COLUMNS) + ['rows']
+
+
+def path_metrics(data):
+    """Group data rows by their full hierarchy path and sum the node metrics."""
+    grouped = data.groupby(LEVELS, sort=False, observed=True)
+    paths = (
+        grouped[list(METRIC_COLUMNS.values())]
+        .sum()
+        .rename(columns={column: metric for metric, column in METRIC_COLUMNS.items()})
+    )
+    paths['rows'] = grouped.size()
+    return paths.reset_index()
+
+
+class HierarchyIndex:
+    """Rollup of every hierarchy node, built once per data snapshot.
+
+    The hierarchy is a tree: each node is keyed by ``(level, path)``, its
+    path being the names from the CNF down to the node, so a name repeated
+    under different parents (e.g. ``Nil`` at RSM or ASM) is a separate node
+    under each of them. Employees are the leaves, one per path their rows
+    fall under. Each node carries its aggregated metrics and the memoized
+    set of its descendants. An index is never changed once built:
+    ``apply_delta`` returns a new index for a handful of changed rows,
+    copying only the nodes on those rows' paths.
+    """
+
+    def __init__(self, data):
+        self.nodes = {}
+        self.level_keys = {level: {} for level in LEVELS}
+        self.descendants = _Closure(self.nodes, 'children')
+        self._employee_paths = {}
+        self._frames = {}
+        self._build(data)
+
+    def _build(self, data):
+        # The only pass over the full dataset: one groupby on the complete path
+        with perf.stage('path_metrics'):
+            paths = path_metrics(data)
+        perf.count('paths', len(paths))
+        self._frames['paths'] = paths
+
+        # Roll up every level from the (much smaller) path table, parents first
+        rollups = self._frames['level_totals'] = level_rollups(paths)
+        columns = PATH_METRICS + ['employees']
+        for level in LEVELS:
+            totals = rollups[level]
+            for path, values in zip(totals.index, totals[columns].itertuples(index=False, name=None)):
+                node = HierarchyNode(level, path)
+                for metric, value in zip(columns, values):
+                    setattr(node, metric, value)
+                self._add_node(node)
+        self._frames['links'] = hierarchy_links(rollups)
+
+        for path in paths[LEVELS].itertuples(index=False, name=None):
+            self._employee_paths.setdefault(path[-1], set()).add(path)
+        perf.count('hierarchy_nodes', len(self.nodes))
+
+    def _add_node(self, node):
+        self.nodes[node.key] = node
+        self.level_keys[node.level][node.key] = None
+        if node.parent is not None:
+            self.nodes[node.parent].children.add(node.key)
+
+    # Table views of the index, rebuilt lazily after an incremental update
+
+    @property
+    def paths(self):
+        paths = self._frames.get('paths')
+        if paths is None:
+            leaves = [self.nodes[key] for key in self.keys(LEVELS[-1])]
+            rows = [leaf.path + tuple(getattr(leaf, metric) for metric in PATH_METRICS) for leaf in leaves]
+            paths = self._frames['paths'] = pd.DataFrame(rows, columns=LEVELS + PATH_METRICS)
+        return paths
+
+    @property
+    def level_totals(self):
+        # Level -> metrics per node, indexed by node path
+        level_totals = self._frames.get('level_totals')
+        if level_totals is None:
+            level_totals = self._frames['level_totals'] = level_rollups(self.paths)
+        return level_totals
+
+    @property
+    def links(self):
+        links = self._frames.get('links')
+        if links is None:
+            links = self._frames['links'] = hierarchy_links(self.level_totals)
+        return links
+
+    def keys(self, level):
+        return self.level_keys[level].keys()
+
+    def names(self, level):
+        # Distinct node names at a level; one name may label nodes under several parents
+        names = self._frames.setdefault('names', {})
+        if level not in names:
+            names[level] = list(dict.fromkeys(path[-1] for _, path in self.keys(level)))
+        return names[level]
+
+    def ancestors(self, key):
+        return ancestor_keys(key)
+
+    def subtree_paths(self, key):
+        # Path rows running through the node, i.e. every path of its subtree
+        level, path = key
+        paths = self.paths
+        mask = pd.Series(True, index=paths.index)
+        for column, name in zip(LEVELS, path):
+            mask &= paths[column] == name
+        return paths[mask]
+
+    @property
+    def employee_names(self):
+        return list(self._employee_paths)
+
+    def has_employee(self, name):
+        return name in self._employee_paths
+
+    def employee_paths(self, name):
+        # Hierarchy paths (with per-path metrics) the employee's rows fall under
+        rows = [leaf.path + tuple(getattr(leaf, metric) for metric in PATH_METRICS) for leaf in self.employee_leaves(name)]
+        return pd.DataFrame(rows, columns=LEVELS + PATH_METRICS)
+
+    def employee_leaves(self, name):
+        # Leaf nodes of the employee, one per path their rows fall under
+        return [self.nodes[(LEVELS[-1], path)] for path in self._employee_paths[name]]
+
+    def employee_metrics(self, name):
+        # Summed over every path the employee's rows fall under
+        leaves = self.employee_leaves(name)
+        rows = sum(leaf.rows for leaf in leaves)
+        total_sales = sum(leaf.sales for leaf in leaves)
+        total_expenses = sum(leaf.expenses for leaf in leaves)
+        return {
+            'total_sales': total_sales,
+            'total_expenses': total_expenses,
+            'average_salary': sum(leaf.salary for leaf in leaves) / rows if rows else 0.0,
+            'target': sum(leaf.target for leaf in leaves) / rows if rows else 0.0,
+            'profit': total_sales - total_expenses,
+        }
+
+    # Incremental updates
+
+    def apply_delta(self, removed, added):
+        """Return a new index with changed data rows applied; this one is left as it was.
+
+        ``removed`` holds the previous version of every changed or deleted
+        row and ``added`` the new version of every changed or inserted row.
+        Only the nodes on those rows' paths are copied and updated; every
+        other node is shared with this index, which readers may still hold.
+        """
+        index = self._copy()
+        copied = {}
+        for frame, sign in ((removed, -1), (added, 1)):
+            if frame is None or frame.empty:
+                continue
+            for values in path_metrics(frame)[LEVELS + PATH_METRICS].itertuples(index=False, name=None):
+                path, metrics = values[:len(LEVELS)], values[len(LEVELS):]
+                index._apply_path(path, [sign * value for value in metrics], copied)
+
+        # Nodes left without rows disappear, leaves first
+        for key in sorted(copied, key=lambda key: -len(key[1])):
+            node = copied[key]
+            if node.rows <= 0:
+                if node.parent is not None:
+                    copied[node.parent].children.discard(key)
+                del index.nodes[key]
+                del index.level_keys[key[0]][key]
+        return index
+
+    def _copy(self):
+        # Shallow copy sharing every node; apply_delta swaps in copies of the nodes it changes
+        index = object.__new__(HierarchyIndex)
+        index.nodes = dict(self.nodes)
+        index.level_keys = {level: dict(keys) for level, keys in self.level_keys.items()}
+        index.descendants = _Closure(index.nodes, 'children')
+        index._employee_paths = dict(self._employee_paths)
+        index._frames = {}
+        return index
+
+    def _apply_path(self, path, values, copied):
+        leaf = self.nodes.get((LEVELS[-1], path))
+        before = leaf.rows if leaf is not None else 0
+        after = before + values[-1]
+        # Employee path sets are shared with the previous index, so they are replaced rather than changed
+        if before <= 0 < after:
+            self._employee_paths[path[-1]] = self._employee_paths.get(path[-1], frozenset()) | {path}
+        elif after <= 0 < before:
+            employee_paths = self._employee_paths[path[-1]] - {path}
+            if employee_paths:
+                self._employee_paths[path[-1]] = employee_paths
+            else:
+                del self._employee_paths[path[-1]]
+        # Nodes count the employee paths running through them
+        employees = int(after > 0) - int(before > 0)
+
+        for depth, level in enumerate(LEVELS):
+            key = (level, path[:depth + 1])
+            node = copied.get(key)
+            if node is None:
+                shared = self.nodes.get(key)
+                node = copied[key] = shared.copy() if shared is not None else HierarchyNode(*key)
+                self._add_node(node)
+            for metric, value in zip(PATH_METRICS, values):
+                setattr(node, metric, getattr(node, metric) + value)
+            node.employees += employees
+
+
+_indexes = LatestCache()
+
+
+@perf.timed('hierarchy_index')
+def get_index(snapshot):
+    """Return the hierarchy index for a data snapshot, building it on first use.
+
+    If the snapshot carries a delta against the snapshot whose index is
+    cached, the new index is derived from that one with ``apply_delta`` and
+    swapped in; sessions still holding the old index keep a consistent view.
+    """
+    def build(previous):
+        delta = snapshot.delta
+        if delta is not None and previous is not None and previous[0] == delta.previous_digest:
+            return previous[1].apply_delta(delta.removed, delta.added)
+        return HierarchyIndex(snapshot.data)
+
+    return _indexes.get(snapshot.path, snapshot.digest, build)
@@ -0,0 +1,145 @@
+"""Chunked ingestion of large per-transaction sales exports.
+
+Reads the export in bounded-memory chunks and pre-aggregates it into the
+compact employee-level table (same columns as data.csv) the apps consume::
+
+    python ingest.py sales_history.csv --output data.csv
+    python ingest.py sales_history.csv --output data.parquet --date-column "Invoice Date" --freq M
+"""
+import argparse
+import time
+import tracemalloc
+
+import pandas as pd
+
+HIERARCHY_COLUMNS = ['CNF', 'Super', 'Distributor', 'RSM', 'ASM']
+
+# Explicit dtypes: repetitive hierarchy/location columns as categoricals, measures as floats
+SOURCE_DTYPES = {
+    'Employee Name': 'string',
+    'Designation': 'string',
+    'Assigned City': 'string',
+    'Assigned State': 'category',
+    **{column: 'category' for column in HIERARCHY_COLUMNS},
+    'Sales - After Closing': 'float64',
+    'Salary': 'float64',
+    'Additional Monthly Expenses': 'float64',
+    'Target': 'float64',
+}
+
+# One output row per employee (and period); the order matches data.csv
+KEY_COLUMNS = ['Employee Name', 'Designation', 'ASM', 'RSM', 'Distributor', 'Super', 'CNF', 'Assigned City', 'Assigned State']
+SUM_COLUMNS = ['Sales - After Closing']
+# Per-employee attributes repeated on every transaction: the latest value wins
+LAST_COLUMNS = ['Salary', 'Additional Monthly Expenses', 'Target']
+
+DEFAULT_CHUNKSIZE = 500_000
+# Chunk partials folded into the running table at once, so it is re-grouped once per batch rather than per chunk
+FOLD_BATCH = 8
+
+CATEGORY_COLUMNS = [column for column, dtype in SOURCE_DTYPES.items() if dtype == 'category']
+
+
+def _aggregate(frame, keys):
+    aggregations = {column: 'sum' for column in SUM_COLUMNS}
+    aggregations.update({column: 'last' for column in LAST_COLUMNS})
+    return frame.groupby(keys, sort=False, observed=True, dropna=False).agg(aggregations).reset_index()
+
+
+def _fold(table, partials, categories, keys):
+    # Every frame is cast to the categories seen so far, so the concatenation stays categorical
+    dtypes = {column: pd.CategoricalDtype(values) for column, values in categories.items()}
+    frames = [frame.astype(dtypes) for frame in ([] if table is None else [table]) + partials]
+    return _aggregate(pd.concat(frames, ignore_index=True), keys)
+
+
+def ingest_csv(path, chunksize=DEFAULT_CHUNKSIZE, period_column=None, date_column=None, freq='M'):
+    """Aggregate a sales export into one row per employee (per period), chunk by chunk.
+
+    The period comes from ``period_column`` if given, or from ``date_column``
+    bucketed at ``freq``. Returns the employee-level table and a stats dict
+    with rows read, chunks, elapsed seconds and peak traced memory.
+    """
+    keys = list(KEY_COLUMNS)
+    usecols = keys + SUM_COLUMNS + LAST_COLUMNS
+    dtypes = dict(SOURCE_DTYPES)
+    if period_column:
+        usecols.append(period_column)
+        dtypes[period_column] = 'string'
+        keys.append(period_column)
+    elif date_column:
+        usecols.append(date_column)
+        keys.append('Period')
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+
+    rows = 0
+    chunks = 0
+    table = None
+    partials = []
+    # Categories seen so far; new ones are appended, so earlier codes stay valid
+    categories = {column: pd.Index([], dtype=object) for column in CATEGORY_COLUMNS}
+    reader = pd.read_csv(path, usecols=usecols, dtype=dtypes, chunksize=chunksize,
+                         parse_dates=[date_column] if date_column and not period_column else None)
+    for chunk in reader:
+        rows += len(chunk)
+        chunks += 1
+        if date_column and not period_column:
+            chunk['Period'] = chunk[date_column].dt.to_period(freq).astype(str)
+            chunk = chunk.drop(columns=[date_column])
+        for column, known in categories.items():
+            categories[column] = known.append(chunk[column].cat.categories.difference(known))
+        partials.append(_aggregate(chunk, keys))
+        # Fold the partials into the running table, which stays employee-sized
+        if len(partials) >= FOLD_BATCH:
+            table = _fold(table, partials, categories, keys)
+            partials = []
+
+    if partials:
+        table = _fold(table, partials, categories, keys)
+    if table is None:
+        table = pd.DataFrame(columns=keys + SUM_COLUMNS + LAST_COLUMNS).astype({column: 'category' for column in CATEGORY_COLUMNS})
+    table = table[KEY_COLUMNS + SUM_COLUMNS + LAST_COLUMNS + keys[len(KEY_COLUMNS):]]
+
+    _, peak = tracemalloc.get_traced_memory()
+    if not tracing:
+        tracemalloc.stop()
+    stats = {
+        'rows': rows,
+        'chunks': chunks,
+        'employees': len(table),
+        'seconds': time.perf_counter() - start,
+        'peak_memory_bytes': peak,
+    }
+    return table, stats
+
+
+def write_table(table, output):
+    if str(output).lower().endswith('.parquet'):
+        table.to_parquet(output, index=False)
+    else:
+        table.to_csv(output, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate a large sales export into the employee-level table.")
+    parser.add_argument('source', help="Per-transaction sales CSV")
+    parser.add_argument('--output', required=True, help="Output .csv or .parquet file")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk (default: %(default)s)")
+    parser.add_argument('--period-column', help="Column holding the sales period")
+    parser.add_argument('--date-column', help="Date column to bucket into periods")
+    parser.add_argument('--freq', default='M', help="Period frequency for --date-column (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    table, stats = ingest_csv(args.source, args.chunksize, args.period_column, args.date_column, args.freq)
+    write_table(table, args.output)
+    print(f"Ingested {stats['rows']:,} rows in {stats['chunks']} chunks into {stats['employees']:,} rows "
+          f"in {stats['seconds']:.2f}s (peak memory {stats['peak_memory_bytes'] / 2**20:.1f} MiB)")
+
+
+if __name__ == '__main__':
+    main()
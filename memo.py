@@ -0,0 +1,37 @@
+"""Process-wide memo of values derived from the current version of each data source.
+
+The hierarchy index, search engine, performance matrix, trends and compute
+core are each held in one of these, keyed by the source (e.g. the snapshot's
+path) and its version (e.g. the snapshot's digest)::
+
+    _indexes = LatestCache()
+    index = _indexes.get(snapshot.path, snapshot.digest, build)
+"""
+import threading
+
+
+class LatestCache:
+    """The value built for the latest version of each source.
+
+    Building a new version replaces only that source's entry, so several
+    sources in one process do not evict each other. Builds run under the
+    cache's lock, so concurrent callers build a version once.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, source, version, build):
+        """Return the value for ``version`` of ``source``, calling ``build(previous)`` if it is not cached.
+
+        ``previous`` is the ``(version, value)`` pair cached for the source,
+        or None, so a build can derive the new value from the old one.
+        """
+        with self._lock:
+            previous = self._entries.get(source)
+            if previous is not None and previous[0] == version:
+                return previous[1]
+            value = build(previous)
+            self._entries[source] = (version, value)
+        return value
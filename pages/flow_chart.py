@@ -0,0 +1,51 @@
+import streamlit as st
+
+from core import get_core, show_chart
+from graph_builder import employee_flow_chart
+from search import employee_selector
+
+# Shared compute core: snapshot, rollup index and search engine live once per process
+core = get_core()
+index = core.index
+search_engine = core.search
+
+# Streamlit app
+st.title("🌟Biolume - Employee Sales Flow Chart")
+st.markdown("Analyze and visualize the performance, expenses, and profit status of each employee in the sales hierarchy.")
+
+# Search box and filter for selecting employees
+selected_employee = employee_selector(search_engine)
+
+# Metrics for the selected employee, read from the rollup index
+employee_metrics = index.employee_metrics(selected_employee)
+total_sales = employee_metrics['total_sales']
+total_expenses = employee_metrics['total_expenses']
+average_salary = employee_metrics['average_salary']
+employee_target = employee_metrics['target']  # Average target for the selected employee
+
+# Calculate profit after grouping
+profit = total_sales - total_expenses
+
+# Generate flow chart: the same DOT as the overview page's, so either page reuses the other's cached render
+flow_chart = employee_flow_chart(index, selected_employee, trends=core.trends)
+
+# Render flow chart in Streamlit
+st.subheader("📈 Sales Hierarchy Flow Chart")
+show_chart(flow_chart)
+
+# Display summary report below the chart
+st.markdown("### 📊 Employee Performance Summary")
+st.markdown(f"""
+- **Employee Name:** `{selected_employee}`
+- **Total Sales:** `₹{total_sales:,.2f}`
+- **Target:** `₹{employee_target:,.2f}`
+- **Total Expenses:** `₹{total_expenses:,.2f}`
+- **Salary:** `₹{average_salary:,.2f}`
+- **Profit:** `{('+' if profit > 0 else '')}₹{profit:,.2f} ({'Profit' if profit > 0 else 'Loss'})`
+""")
+
+# Emphasize on profit or loss status
+if profit > 0:
+    st.success("This employee is in profit! 🎉")
+else:
+    st.error("This employee is currently operating at a loss. 📉")
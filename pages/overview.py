@@ -0,0 +1,195 @@
+import os
+import tempfile
+
+import altair as alt
+import streamlit as st
+import graphviz
+
+from core import get_core, show_chart
+from export_chart import export_chart
+from graph_builder import LEVEL_COLORS, employee_flow_chart, lod_flow_chart, overall_flow_chart, paths_flow_chart
+from hierarchy import LEVELS, level_label
+from performance import BAND_COLORS, BANDS, RANK_COLUMNS, achievement_band, band_counts
+from search import employee_selector
+from summary_image import calculate_target_percentage
+from timeseries import format_trend
+
+# Shared compute core: snapshot, rollup index, search engine and render cache live once per process
+core = get_core()
+snapshot = core.snapshot
+index = core.index
+search_engine = core.search
+render_cache = core.render_cache
+
+# Period-over-period trends, only when a multi-period store has been built (see timeseries.py)
+trends = core.trends
+
+# Streamlit app setup
+st.title("Biolume - Sales Flow Chart")
+st.markdown("Analyze the performance, expenses, profit, and target achievement status of each employee in the sales hierarchy.")
+
+# Employee search and selection
+selected_employee = employee_selector(search_engine)
+
+# Metrics for the selected employee, read from the rollup index
+employee_metrics = index.employee_metrics(selected_employee)
+total_sales = employee_metrics['total_sales']
+total_expenses = employee_metrics['total_expenses']
+average_salary = employee_metrics['average_salary']
+employee_target = employee_metrics['target']
+profit = employee_metrics['profit']
+
+# Calculate target achievement percentage and color code
+target_percentage = calculate_target_percentage(total_sales, employee_target)
+color = achievement_band(target_percentage)
+
+# Generate the employee-specific flow chart
+employee_chart = employee_flow_chart(index, selected_employee, trends=trends)
+
+# Render employee-specific flow chart
+st.subheader("📈 Employee-Specific Sales Hierarchy Flow Chart")
+show_chart(employee_chart)
+
+# Employee Performance Summary
+st.markdown("### 📊 Employee Performance Summary with Target Achievement")
+st.markdown(f"""
+- **Employee Name:** `{selected_employee}`
+- **Total Sales:** `₹{total_sales:,.2f}`
+- **Target:** `₹{employee_target:,.2f}`
+- **Total Expenses:** `₹{total_expenses:,.2f}`
+- **Salary:** `₹{average_salary:,.2f}`
+- **Profit:** `{('+' if profit > 0 else '')}₹{profit:,.2f} ({'Profit' if profit > 0 else 'Loss'})`
+- **Target Achievement:** `{target_percentage:.2f}%`
+""")
+
+# Trend over the stored periods for the selected employee
+employee_trend = trends.latest('Employee Name', selected_employee) if trends else None
+if employee_trend:
+    st.markdown(f"- **Trend ({trends.periods[-1]}):** `{format_trend(employee_trend)}` "
+                f"- **Cumulative Target Achievement:** `{employee_trend['cumulative_achievement']:.2f}%`")
+    history = trends.history('Employee Name', selected_employee)[['sales', 'rolling_sales']]
+    st.line_chart(history.set_axis(history.index.astype(str)))
+
+# Display the performance status with color-coded segment
+st.markdown(f"<div style='background-color:{color};padding:10px;border-radius:5px;color:white;text-align:center;'>Target Achievement Status: {target_percentage:.2f}%</div>", unsafe_allow_html=True)
+
+# Subtree queries: everyone under a node, optionally only at a state/city
+st.subheader("🔎 Hierarchy Search")
+# Tables and charts of large subtrees are capped to keep reruns fast
+SUBTREE_TABLE_LIMIT = 1000
+SUBTREE_CHART_LIMIT = 300
+search_columns = st.columns(4)
+search_level = search_columns[0].selectbox("Level", LEVELS[:-1], format_func=level_label)
+search_state = search_columns[1].selectbox("State", [''] + search_engine.locations('Assigned State'), format_func=lambda value: value or "Any")
+search_city = search_columns[2].selectbox("City", [''] + search_engine.locations('Assigned City'), format_func=lambda value: value or "Any")
+node_query = search_columns[3].text_input(f"Search {level_label(search_level)}")
+node_matches = search_engine.autocomplete(node_query, search_level, state=search_state, city=search_city)
+selected_node = st.selectbox(f"{level_label(search_level)} ({len(node_matches)} shown)", node_matches) if node_matches else None
+if selected_node:
+    team = search_engine.subtree(search_level, selected_node, state=search_state, city=search_city)
+    st.caption(f"{len(team):,} employees under {level_label(search_level)} {selected_node}")
+    st.dataframe(core.matrix.set_index('Employee Name').loc[team[:SUBTREE_TABLE_LIMIT]])
+    subtree_paths = search_engine.subtree_paths(search_level, selected_node)
+    if len(subtree_paths) < SUBTREE_CHART_LIMIT:
+        show_chart(paths_flow_chart(subtree_paths, top=search_level))
+    else:
+        st.info(f"This subtree has {len(subtree_paths):,} employee paths; use the level-of-detail chart below to explore it.")
+else:
+    st.info("No matching nodes.")
+
+# Performance matrix of every employee, computed once per snapshot
+st.subheader("All-Employee Performance Matrix")
+matrix = core.matrix
+
+matrix_columns = st.columns(3)
+sort_column = matrix_columns[0].selectbox("Sort by", ['Achievement %', 'Total Sales', 'Profit'] + [f'Rank in {column}' for column in RANK_COLUMNS])
+descending = matrix_columns[1].toggle("Descending", value=not sort_column.startswith('Rank'))
+selected_bands = matrix_columns[2].multiselect("Bands", BANDS, default=BANDS)
+
+filtered = matrix[matrix['Band'].isin(selected_bands)] if len(selected_bands) < len(BANDS) else matrix
+filtered = filtered.sort_values(sort_column, ascending=not descending, kind='stable')
+
+# Only the visible page is sent to the browser
+page_columns = st.columns(2)
+page_size = page_columns[0].selectbox("Rows per page", [25, 50, 100, 250], index=1)
+page_count = max(1, -(-len(filtered) // page_size))
+page = page_columns[1].number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1)
+page_rows = filtered.iloc[(page - 1) * page_size:page * page_size]
+st.dataframe(
+    page_rows.style.map(lambda band: f"background-color:{BAND_COLORS[band]};color:white", subset=['Band'])
+    .format({'Achievement %': '{:.2f}%', 'Total Sales': '₹{:,.2f}', 'Target': '₹{:,.2f}', 'Profit': '₹{:,.2f}'}),
+    hide_index=True,
+)
+st.caption(f"{len(filtered):,} of {len(matrix):,} employees")
+
+# Heatmap of band counts per RSM/ASM/State, limited to the largest groups
+heatmap_by = st.radio("Heatmap by", RANK_COLUMNS, horizontal=True)
+counts = band_counts(filtered, heatmap_by).reset_index().melt(id_vars=heatmap_by, var_name='Band', value_name='Employees')
+heatmap = alt.Chart(counts).mark_rect().encode(
+    x=alt.X('Band:N', sort=BANDS),
+    y=alt.Y(f'{heatmap_by}:N', sort=None),
+    color=alt.Color('Employees:Q', scale=alt.Scale(scheme='blues')),
+    tooltip=[heatmap_by, 'Band', 'Employees'],
+)
+st.altair_chart(heatmap, width='stretch')
+
+# Overall Hierarchy Flowchart (for the whole dataset)
+st.subheader("Overall Sales Flow Chart")
+
+# Level of detail keeps layout bounded: start collapsed at CNF/Super and expand subtrees on demand
+chart_mode = st.radio("Chart detail", ["Level of detail", "Full chart"], horizontal=True)
+if chart_mode == "Level of detail":
+    # Nodes expanded before a data change may no longer exist
+    expanded = [key for key in st.session_state.get('expanded_nodes', []) if key in index.nodes]
+    st.session_state['expanded_nodes'] = expanded
+    max_children = st.slider("Max children per node", 5, 100, 25)
+    max_nodes = st.slider("Max nodes per render", 50, 1000, 200, step=50)
+
+    # Offer the expandable nodes of the current view, plus those already expanded
+    visible = set(expanded)
+    for key in expanded:
+        visible |= index.nodes[key].children
+    for root in index.keys('CNF'):
+        visible |= index.nodes[root].children
+    expandable = sorted((key for key in visible if index.nodes[key].children), key=lambda key: (LEVELS.index(key[0]), key[1]))
+    st.multiselect("Expand nodes", expandable, key='expanded_nodes',
+                   format_func=lambda key: f"{level_label(key[0])}: {' › '.join(map(str, key[1]))}")
+
+    overall_chart = lod_flow_chart(index, st.session_state['expanded_nodes'], LEVEL_COLORS, max_children, max_nodes)
+else:
+    # Generate the overall hierarchy flow chart
+    overall_chart = overall_flow_chart(index)
+
+# Render the overall hierarchy flow chart
+show_chart(overall_chart)
+
+# Full-chart export, laid out per CNF/Super partition in parallel
+with st.expander("Export full chart"):
+    chart_format = st.radio("Chart format", ["Stitched SVG", "Multi-page PDF"], horizontal=True)
+    partition_level = st.radio("Partition by", ['CNF', 'Super'], horizontal=True)
+    if st.button("Export overall chart"):
+        suffix = '.pdf' if chart_format == "Multi-page PDF" else '.svg'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            export_path = os.path.join(tmp_dir, f'sales_flow_chart{suffix}')
+            try:
+                with st.spinner("Laying out partitions..."):
+                    export_stats = export_chart(index, export_path, level=partition_level)
+            except graphviz.ExecutableNotFound:
+                st.warning("Exporting needs a local Graphviz install.")
+                export_stats = None
+            if export_stats:
+                with open(export_path, 'rb') as f:
+                    export_bytes = f.read()
+        if export_stats:
+            st.caption(f"Laid out {export_stats['partitions']} partitions in {export_stats['seconds']:.2f}s "
+                       f"on {export_stats['workers']} workers")
+            st.download_button(
+                label="Download Chart",
+                data=export_bytes,
+                file_name=f"sales_flow_chart{suffix}",
+                mime="application/pdf" if suffix == '.pdf' else "image/svg+xml"
+            )
+
+# Render cache statistics, for sizing the cache
+with st.expander("Chart render cache"):
+    st.json(render_cache.stats())
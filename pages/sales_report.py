@@ -0,0 +1,46 @@
+import streamlit as st
+
+from core import get_core, show_chart
+from graph_builder import employee_flow_chart
+from search import employee_selector
+
+# Shared compute core: snapshot, rollup index and search engine live once per process
+core = get_core()
+index = core.index
+search_engine = core.search
+
+# Streamlit app
+st.title("Employee Sales Report")
+st.markdown("### Overview of Employee Performance and Sales")
+
+# Search box and filter for selecting employees
+selected_employee = employee_selector(search_engine, "Select Employee")
+
+# Metrics for the selected employee, read from the rollup index
+employee_metrics = index.employee_metrics(selected_employee)
+total_sales = employee_metrics['total_sales']
+total_expenses = employee_metrics['total_expenses']
+average_salary = employee_metrics['average_salary']
+
+# Calculate profit after grouping
+profit = total_sales - total_expenses
+
+# Generate flow chart: box nodes, lightgreen distributors, and the employee colored by profit or loss
+flow_chart = employee_flow_chart(
+    index, selected_employee,
+    [('CNF', 'lightblue'), ('Super', 'lightyellow'), ('Distributor', 'lightgreen'), ('RSM', 'lightcoral'), ('ASM', 'lightpink')],
+    employee_color=lambda employee_profit: 'lightgreen' if employee_profit > 0 else 'lightcoral',
+    style={'shape': 'box'}, size='10,8', show_target=False,
+)
+
+# Render flow chart in Streamlit
+st.subheader("Sales Hierarchy Flow Chart")
+show_chart(flow_chart)
+
+# Display summary report below the chart
+st.markdown("### Summary of Employee Performance")
+st.write(f"**Employee Name:** {selected_employee}")
+st.write(f"**Total Sales:** ₹{total_sales:,.2f}")
+st.write(f"**Total Expenses:** ₹{total_expenses:,.2f}")
+st.write(f"**Salary:** ₹{average_salary:,.2f}")
+st.write(f"**Profit:** ₹{profit:,.2f}")
@@ -0,0 +1,70 @@
+import streamlit as st
+import os
+import tempfile
+
+from batch_export import export_summaries
+from core import get_core
+from search import employee_selector
+from summary_image import calculate_target_percentage, generate_professional_performance_summary_image, performance_summary_text, target_color
+
+# Shared compute core: snapshot, rollup index and search engine live once per process
+core = get_core()
+index = core.index
+search_engine = core.search
+
+# Streamlit app setup
+st.title("🌟Biolume - Employee Sales Flow Chart with Performance Matrix")
+st.markdown("Analyze the performance, expenses, profit, and target achievement status of each employee in the sales hierarchy.")
+
+# Employee search and selection
+selected_employee = employee_selector(search_engine)
+
+# Metrics for the selected employee, read from the rollup index
+employee_metrics = index.employee_metrics(selected_employee)
+total_sales = employee_metrics['total_sales']
+total_expenses = employee_metrics['total_expenses']
+average_salary = employee_metrics['average_salary']
+employee_target = employee_metrics['target']
+profit = total_sales - total_expenses
+
+# Calculate target achievement percentage and color code
+target_percentage = calculate_target_percentage(total_sales, employee_target)
+color = target_color(target_percentage)
+
+# Employee Performance Summary
+performance_summary = performance_summary_text(selected_employee, total_sales, employee_target, total_expenses, average_salary, profit, target_percentage)
+
+# Generate the professional performance summary image
+img_io = generate_professional_performance_summary_image(performance_summary, target_percentage, color)
+
+# Display the image in Streamlit
+st.subheader("📊 Employee Performance Summary with Target Achievement")
+st.image(img_io, caption='Employee Performance Summary', width='stretch')
+
+# Provide a download link for the image
+st.download_button(
+    label="Download Employee Performance Summary",
+    data=img_io,
+    file_name="employee_performance_summary.png",
+    mime="image/png"
+)
+
+# Month-end batch export of every employee's summary
+st.subheader("📦 Export All Employee Summaries")
+export_format = st.radio("Export format", ["ZIP of PNGs", "Multi-page PDF"], horizontal=True)
+if st.button("Generate summaries for all employees"):
+    suffix = '.pdf' if export_format == "Multi-page PDF" else '.zip'
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        export_path = os.path.join(tmp_dir, f'employee_performance_summaries{suffix}')
+        with st.spinner("Rendering summaries..."):
+            export_stats = export_summaries(index, export_path)
+        with open(export_path, 'rb') as f:
+            export_bytes = f.read()
+    st.caption(f"Rendered {export_stats['images']} summaries in {export_stats['seconds']:.2f}s "
+               f"({export_stats['images_per_second']:.1f} images/s on {export_stats['workers']} workers)")
+    st.download_button(
+        label="Download All Summaries",
+        data=export_bytes,
+        file_name=f"employee_performance_summaries{suffix}",
+        mime="application/pdf" if suffix == '.pdf' else "application/zip"
+    )
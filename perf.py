@@ -0,0 +1,177 @@
+"""Lightweight timing, counters and optional cProfile capture per app rerun.
+
+Instrumentation is off unless ``PERF_TRACE=1`` is set. When it is off,
+``start_run`` returns None and every ``stage``/``timed``/``count`` call is a
+single context-variable lookup. When on, each rerun records::
+
+    run = perf.start_run('overview', profile=True)
+    with perf.stage('read_source'):
+        data = pd.read_csv(path)
+    perf.count('rows_read', len(data))
+    run.finish()          # appends a JSON line to $PERF_LOG if set
+
+and ``show_panel(run)`` renders the collapsible "Performance" panel.
+"""
+import contextvars
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import nullcontext
+
+PERF_ENABLED = os.environ.get('PERF_TRACE', '') not in ('', '0')
+PERF_PROFILE = os.environ.get('PERF_PROFILE', '') not in ('', '0')
+PERF_LOG = os.environ.get('PERF_LOG')
+
+_current = contextvars.ContextVar('perf_run', default=None)
+_log_lock = threading.Lock()
+_NULL = nullcontext()
+
+
+class Run:
+    """Stage timings and counters for one rerun (or one CLI invocation)."""
+
+    def __init__(self, name, profile=False):
+        self.name = name
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self.seconds = None
+        self.stages = {}
+        self.timeline = []
+        self.counters = {}
+        self._depth = 0
+        self._profiler = cProfile.Profile() if profile else None
+        self.profile_text = None
+        if self._profiler is not None:
+            self._profiler.enable()
+
+    def stage(self, name):
+        return _Stage(self, name)
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def finish(self, profile_limit=30):
+        if self.seconds is not None:
+            return self
+        self.seconds = time.perf_counter() - self._start
+        if self._profiler is not None:
+            self._profiler.disable()
+            stream = io.StringIO()
+            pstats.Stats(self._profiler, stream=stream).sort_stats('cumulative').print_stats(profile_limit)
+            self.profile_text = stream.getvalue()
+            self._profiler = None
+        if _current.get() is self:
+            _current.set(None)
+        if PERF_LOG:
+            with _log_lock, open(PERF_LOG, 'a') as f:
+                f.write(json.dumps(self.to_dict()) + '\n')
+        return self
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'started': self.started,
+            'seconds': self.seconds,
+            'stages': self.stages,
+            'timeline': self.timeline,
+            'counters': self.counters,
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2)
+
+
+class _Stage:
+    __slots__ = ('run', 'name', 'start', 'depth')
+
+    def __init__(self, run, name):
+        self.run = run
+        self.name = name
+
+    def __enter__(self):
+        self.depth = self.run._depth
+        self.run._depth += 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        run = self.run
+        run._depth -= 1
+        totals = run.stages.setdefault(self.name, {'calls': 0, 'seconds': 0.0})
+        totals['calls'] += 1
+        totals['seconds'] += elapsed
+        run.timeline.append({'stage': self.name, 'depth': self.depth,
+                             'offset': self.start - run._start, 'seconds': elapsed})
+        return False
+
+
+def start_run(name, profile=None):
+    """Start recording a run in the current context; None when instrumentation is off."""
+    if not PERF_ENABLED:
+        return None
+    previous = _current.get()
+    if previous is not None:
+        previous.finish()
+    run = Run(name, PERF_PROFILE if profile is None else profile)
+    _current.set(run)
+    return run
+
+
+def current_run():
+    return _current.get()
+
+
+def stage(name):
+    # Time a block; a shared no-op context when nothing is recording
+    run = _current.get()
+    return _NULL if run is None else run.stage(name)
+
+
+def count(name, amount=1):
+    run = _current.get()
+    if run is not None:
+        run.count(name, amount)
+
+
+def timed(name=None):
+    """Decorator timing every call of a function as a stage (default: its qualified name)."""
+    def decorate(fn):
+        stage_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            run = _current.get()
+            if run is None:
+                return fn(*args, **kwargs)
+            with run.stage(stage_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def show_panel(run):
+    """Collapsible Streamlit panel with stage timings, counters, the profile and a JSON download."""
+    if run is None:
+        return
+    import pandas as pd
+    import streamlit as st
+
+    run.finish()
+    with st.expander(f"Performance ({run.seconds * 1000:.0f} ms)"):
+        stages = pd.DataFrame.from_dict(run.stages, orient='index')
+        if not stages.empty:
+            stages['ms'] = stages.pop('seconds') * 1000
+            st.dataframe(stages.sort_values('ms', ascending=False))
+        if run.counters:
+            st.json(run.counters)
+        st.checkbox("Profile next rerun (cProfile)", key='perf_profile')
+        if run.profile_text:
+            st.code(run.profile_text)
+        st.download_button("Download timings (JSON)", run.to_json(), file_name=f"{run.name}_perf.json",
+                           mime="application/json")
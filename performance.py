@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+import perf
+from memo import LatestCache
+
+# Target achievement bands: below 30% red, 30-50% orange, 50-90% yellow, 90% and above green
+BAND_EDGES = [30, 50, 90]
+BANDS = ['red', 'orange', 'yellow', 'green']
+BAND_COLORS = {'red': '#dc3545', 'orange': '#fd7e14', 'yellow': '#ffc107', 'green': '#28a745'}
+
+# Columns each employee is ranked within
+RANK_COLUMNS = ['RSM', 'ASM', 'Assigned State']
+
+_matrices = LatestCache()
+
+
+def achievement_band(target_percentage):
+    # Scalar band for a single employee, using the same edges as the matrix
+    return BANDS[int(np.searchsorted(BAND_EDGES, target_percentage, side='right'))]
+
+
+def achievement_bands(target_percentage):
+    return pd.cut(target_percentage, [-np.inf, *BAND_EDGES, np.inf], labels=BANDS, right=False)
+
+
+@perf.timed('performance_matrix')
+def performance_matrix(data):
+    """One row per employee with achievement %, band, profit and ranks.
+
+    Metrics match ``HierarchyIndex.employee_metrics``: sales and additional
+    expenses are summed over the employee's rows, salary and target averaged.
+    Each employee is ranked by achievement within their (first) RSM, ASM and
+    state, 1 being the best.
+    """
+    grouped = data.groupby('Employee Name', sort=False, observed=True)
+    matrix = grouped.agg(**{
+        'RSM': ('RSM', 'first'),
+        'ASM': ('ASM', 'first'),
+        'Assigned State': ('Assigned State', 'first'),
+        'Total Sales': ('Sales - After Closing', 'sum'),
+        'Target': ('Target', 'mean'),
+        'Salary': ('Salary', 'mean'),
+        'Expenses': ('Additional Monthly Expenses', 'sum'),
+    })
+
+    sales = matrix['Total Sales'].to_numpy(dtype=float)
+    target = matrix['Target'].to_numpy(dtype=float)
+    achievement = np.divide(sales * 100, target, out=np.zeros_like(sales), where=target > 0)
+    matrix['Achievement %'] = achievement
+    matrix['Band'] = achievement_bands(achievement)
+    matrix['Profit'] = matrix['Total Sales'] - matrix['Expenses']
+    matrix['Profit Status'] = np.where(matrix['Profit'] > 0, 'Profit', 'Loss')
+
+    for column in RANK_COLUMNS:
+        ranks = matrix.groupby(column, sort=False, observed=True)['Achievement %'].rank(method='min', ascending=False)
+        matrix[f'Rank in {column}'] = ranks.astype('Int64')
+    return matrix.reset_index()
+
+
+def band_counts(matrix, by, limit=50):
+    """Employees per band for each value of ``by``, largest groups first (heatmap input)."""
+    counts = pd.crosstab(matrix[by], matrix['Band']).reindex(columns=BANDS, fill_value=0)
+    counts = counts.loc[counts.sum(axis=1).sort_values(ascending=False).index[:limit]]
+    counts.columns = counts.columns.astype(str)
+    return counts
+
+
+def get_performance_matrix(snapshot):
+    # Built once per snapshot and shared by every session; treat it as read-only
+    return _matrices.get(snapshot.path, snapshot.digest, lambda previous: performance_matrix(snapshot.data))
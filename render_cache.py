@@ -0,0 +1,127 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import graphviz
+
+import perf
+
+RENDER_CACHE_DIR = os.environ.get('RENDER_CACHE_DIR')
+RENDER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class RenderCache:
+    """Laid-out chart images keyed by a hash of their DOT source.
+
+    Entries live in an in-memory LRU capped at ``max_bytes``; when
+    ``disk_dir`` is set, renders are also written there and survive restarts.
+    """
+
+    def __init__(self, max_bytes=RENDER_CACHE_MAX_BYTES, disk_dir=None, engine='dot'):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.engine = engine
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(source, fmt):
+        return hashlib.sha1(f'{fmt}\n{source}'.encode('utf-8')).hexdigest()
+
+    def _disk_path(self, key, fmt):
+        return os.path.join(self.disk_dir, f'{key}.{fmt}')
+
+    def _store(self, key, image):
+        # Callers hold the lock
+        if len(image) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._size -= len(self._entries.pop(key))
+        self._entries[key] = image
+        self._size += len(image)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def _read_disk(self, key, fmt):
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key, fmt), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, key, fmt, image):
+        if not self.disk_dir:
+            return
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            path = self._disk_path(key, fmt)
+            with open(path + '.tmp', 'wb') as f:
+                f.write(image)
+            os.replace(path + '.tmp', path)
+        except OSError:
+            pass
+
+    def render(self, source, fmt='svg'):
+        """Return the rendered ``fmt`` bytes for DOT ``source``, laying it out only on a miss."""
+        key = self.key(source, fmt)
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                perf.count('render_cache_hits')
+                return image
+
+        image = self._read_disk(key, fmt)
+        if image is not None:
+            with self._lock:
+                self.disk_hits += 1
+                self._store(key, image)
+            return image
+
+        # Layout runs outside the lock so concurrent renders of different charts don't serialize
+        with perf.stage('graphviz_layout'):
+            image = graphviz.pipe(self.engine, fmt, source.encode('utf-8'))
+        perf.count('graphviz_bytes', len(image))
+        self._write_disk(key, fmt, image)
+        with self._lock:
+            self.misses += 1
+            self._store(key, image)
+        return image
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+            }
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_render_cache():
+    """Process-wide render cache shared by every app and session."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = RenderCache(disk_dir=RENDER_CACHE_DIR)
+    return _default_cache
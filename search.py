@@ -0,0 +1,140 @@
+import difflib
+from bisect import bisect_left
+
+import perf
+from hierarchy import LEVELS, get_index, level_label
+from memo import LatestCache
+
+LOCATION_COLUMNS = ['Assigned State', 'Assigned City']
+AUTOCOMPLETE_LIMIT = 50
+# Fuzzy matching scores every candidate, so it only runs over this many names sharing the query's first letter
+FUZZY_CANDIDATES = 5_000
+
+_engines = LatestCache()
+
+
+class SearchEngine:
+    """Name lookup and subtree queries over a hierarchy index.
+
+    Every node name is indexed by the lowercase full name and by each later
+    word in it, so "sharma" finds "Prashant Sharma". Lookups are bisections
+    into the sorted index; fuzzy matching falls back to difflib. Location
+    filters use the states and cities each node's rows are assigned to.
+    """
+
+    def __init__(self, index, data):
+        self.index = index
+        entries = []
+        for depth, level in enumerate(LEVELS):
+            for name in index.names(level):
+                words = str(name).lower().split()
+                for position in range(len(words)):
+                    entries.append((' '.join(words[position:]), depth, str(name)))
+        entries.sort()
+        self._terms = [term for term, _, _ in entries]
+        self._entries = [(LEVELS[level], name) for _, level, name in entries]
+        self._names = {level: sorted({str(name).lower(): name for name in index.names(level)}.items())
+                       for level in LEVELS}
+
+        # (column, value) -> level -> names of the nodes with rows at that location
+        self._locations = {}
+        for column in LOCATION_COLUMNS:
+            if column not in data.columns:
+                continue
+            for level in LEVELS:
+                pairs = data[[column, level]].drop_duplicates()
+                for value, names in pairs.groupby(column, observed=True)[level]:
+                    self._locations.setdefault((column, value), {})[level] = set(names.astype(str))
+
+    def locations(self, column):
+        return sorted(value for location_column, value in self._locations if location_column == column)
+
+    def _located(self, level, state=None, city=None):
+        # Names at ``level`` matching every given location filter, or None when unfiltered
+        found = None
+        for column, value in zip(LOCATION_COLUMNS, (state, city)):
+            if value:
+                names = self._locations.get((column, value), {}).get(level, set())
+                found = names if found is None else found & names
+        return found
+
+    def prefix(self, text, level=None, limit=AUTOCOMPLETE_LIMIT):
+        """Nodes whose name, or a word in it, starts with ``text``; ``(level, name)`` keys in name order."""
+        text = text.strip().lower()
+        results = {}
+        position = bisect_left(self._terms, text)
+        while position < len(self._terms) and self._terms[position].startswith(text):
+            key = self._entries[position]
+            if level is None or key[0] == level:
+                results.setdefault(key, None)
+                if limit and len(results) >= limit:
+                    break
+            position += 1
+        return list(results)
+
+    def fuzzy(self, text, level=LEVELS[-1], limit=10, cutoff=0.6):
+        """Closest names at ``level`` by difflib similarity, best first."""
+        text = text.strip().lower()
+        if not text:
+            return []
+        names = self._names[level]
+        if len(names) > FUZZY_CANDIDATES:
+            start = bisect_left(names, (text[0],))
+            end = bisect_left(names, (chr(ord(text[0]) + 1),))
+            names = names[start:end][:FUZZY_CANDIDATES]
+        lookup = dict(names)
+        matches = difflib.get_close_matches(text, list(lookup), n=limit, cutoff=cutoff)
+        return [(level, lookup[match]) for match in matches]
+
+    @perf.timed('search_autocomplete')
+    def autocomplete(self, text, level=LEVELS[-1], limit=AUTOCOMPLETE_LIMIT, state=None, city=None):
+        """Prefix matches (fuzzy matches if there are none), filtered by location; at most ``limit`` names."""
+        located = self._located(level, state, city)
+        results = []
+        for key in self.prefix(text, level, limit=None if located is not None else limit):
+            if located is None or key[1] in located:
+                results.append(key[1])
+                if len(results) >= limit:
+                    return results
+        if not results and text.strip():
+            results = [name for _, name in self.fuzzy(text, level, limit) if located is None or name in located]
+        return results
+
+    def subtree_paths(self, level, name):
+        """Path rows (see ``hierarchy.path_metrics``) running through any ``level`` node named ``name``."""
+        paths = self.index.paths
+        paths = paths[paths[level] == name]
+        if paths.empty:
+            raise KeyError(f"Unknown {level_label(level)}: {name}")
+        return paths
+
+    @perf.timed('search_subtree')
+    def subtree(self, level, name, target_level=LEVELS[-1], state=None, city=None):
+        """Names at ``target_level`` under the ``level`` node(s) named ``name``, e.g. every employee under an RSM."""
+        located = self._located(target_level, state, city)
+        names = set(self.subtree_paths(level, name)[target_level])
+        if located is not None:
+            names &= located
+        return sorted(names)
+
+    def at_level(self, level, state=None, city=None):
+        """Every node name at ``level``, optionally only those at a state/city (e.g. all ASMs in EAST INDIA)."""
+        located = self._located(level, state, city)
+        return sorted(name for name in self.index.names(level) if located is None or name in located)
+
+
+def get_search_engine(snapshot):
+    # Built once per snapshot and shared by every session
+    return _engines.get(snapshot.path, snapshot.digest, lambda previous: SearchEngine(get_index(snapshot), snapshot.data))
+
+
+def employee_selector(engine, label="Select an Employee to View Details", key='employee', limit=AUTOCOMPLETE_LIMIT):
+    """Streamlit search box plus a select box over at most ``limit`` matching employees."""
+    import streamlit as st
+
+    query = st.text_input("Search employees", key=f'{key}_search', placeholder="Type a name (prefix or approximate)")
+    matches = engine.autocomplete(query, limit=limit)
+    if not matches:
+        st.warning(f"No employee matches {query!r}")
+        st.stop()
+    return st.selectbox(label, matches, key=key)
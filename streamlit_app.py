@@ -0,0 +1,31 @@
+"""Biolume sales dashboards as one multipage Streamlit app::
+
+    streamlit run streamlit_app.py
+
+Every page reads the process-wide compute core (core.py), so the data
+snapshot, rollup index, search engine and render cache are built once per
+process and shared by all pages and sessions. Per-session state is limited
+to widget values.
+"""
+import streamlit as st
+
+import perf
+
+st.set_page_config(page_title="Biolume Sales", page_icon="🌟", layout="wide")
+
+# Stage timings for this rerun (PERF_TRACE=1), shown in the performance panel below the page
+perf_run = perf.start_run('streamlit_app', profile=st.session_state.get('perf_profile'))
+
+page = st.navigation([
+    st.Page('pages/overview.py', title="Sales Flow Chart", icon="📈", default=True),
+    st.Page('pages/flow_chart.py', title="Employee Flow Chart", icon="🌟"),
+    st.Page('pages/sales_report.py', title="Sales Report", icon="📋"),
+    st.Page('pages/summary_cards.py', title="Performance Summary Cards", icon="🖼️"),
+])
+if perf_run is not None:
+    # The default page has an empty URL path
+    perf_run.name = page.url_path or 'overview'
+page.run()
+
+# Stage timings, counters and optional profile for this rerun
+perf.show_panel(perf_run)
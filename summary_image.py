@@ -0,0 +1,161 @@
+import io
+import threading
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+import perf
+from performance import BAND_COLORS, achievement_band
+
+
+# Format currency with the Rs symbol and commas for thousands
+def format_currency(value):
+    return f"Rs {value:,.2f}"
+
+
+def calculate_target_percentage(total_sales, target):
+    return (total_sales / target) * 100 if target > 0 else 0
+
+
+# Color code for a target achievement percentage (same bands as the performance matrix)
+def target_color(target_percentage):
+    return BAND_COLORS[achievement_band(target_percentage)]
+
+
+def performance_summary_text(employee_name, total_sales, employee_target, total_expenses, average_salary, profit, target_percentage):
+    return f"""
+Employee Performance Summary:
+---------------------------
+Employee Name: {employee_name}
+Total Sales: {format_currency(total_sales)}
+
+Target: {format_currency(employee_target)}
+
+Total Expenses: {format_currency(total_expenses)}
+
+Salary: {format_currency(average_salary)}
+
+Profit: {('+' if profit > 0 else '')}{format_currency(profit)} ({'Profit' if profit > 0 else 'Loss'})
+
+Target Achievement: {target_percentage:.2f}%
+"""
+
+
+def employee_summary(index, employee_name):
+    """Summary text, achievement percentage and color for one employee of a hierarchy index."""
+    metrics = index.employee_metrics(employee_name)
+    percentage = calculate_target_percentage(metrics['total_sales'], metrics['target'])
+    text = performance_summary_text(employee_name, metrics['total_sales'], metrics['target'], metrics['total_expenses'],
+                                    metrics['average_salary'], metrics['profit'], percentage)
+    return text, percentage, target_color(percentage)
+
+
+# Fonts are loaded once per process and reused by every image
+@lru_cache(maxsize=None)
+def load_fonts():
+    try:
+        font_header = ImageFont.truetype("arialbd.ttf", 20)  # Bold font for header
+        font_body = ImageFont.truetype("arial.ttf", 18)  # Regular font for body
+        font_bold = ImageFont.truetype("arialbd.ttf", 22)  # Bold font for percentage
+    except IOError:
+        font_header = ImageFont.load_default()
+        font_body = ImageFont.load_default()
+        font_bold = ImageFont.load_default()
+    return font_header, font_body, font_bold
+
+
+# Output encodings: Pillow format, MIME type and the save options each one takes
+IMAGE_FORMATS = {
+    'png': ('PNG', 'image/png'),
+    'jpeg': ('JPEG', 'image/jpeg'),
+    'webp': ('WEBP', 'image/webp'),
+}
+IMAGE_SIZE = (700, 450)
+BORDER_COLOR = "#007bff"  # Blue border color
+TITLE_COLOR = "#007bff"  # Blue color for the title
+
+
+class SummaryRenderer:
+    """Reusable renderer for performance summary images.
+
+    Fonts are loaded once and the static parts (background, border and
+    title) are drawn once into a template that each render copies. Encoded
+    output goes through a per-thread buffer that is reused between images.
+    ``quality`` applies to JPEG and WebP, ``compress_level`` (0-9) to PNG.
+    """
+
+    def __init__(self, image_format='png', quality=85, compress_level=6):
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported image format: {image_format!r}")
+        self.image_format = image_format
+        self.pil_format, self.mime_type = IMAGE_FORMATS[image_format]
+        if image_format == 'png':
+            self.save_options = {'compress_level': compress_level}
+        else:
+            self.save_options = {'quality': quality}
+        self.fonts = load_fonts()
+        self.template = self._render_template()
+        self._local = threading.local()
+
+    @property
+    def extension(self):
+        return 'jpg' if self.image_format == 'jpeg' else self.image_format
+
+    def _render_template(self):
+        img_width, img_height = IMAGE_SIZE
+        img = Image.new('RGB', IMAGE_SIZE, color='white')
+        draw = ImageDraw.Draw(img)
+        font_header, _, _ = self.fonts
+
+        # Draw a border around the image
+        draw.rectangle([5, 5, img_width-5, img_height-5], outline=BORDER_COLOR, width=3)
+
+        # Add a title header with a different color
+        draw.text((20, 20), "Employee Performance Summary", font=font_header, fill=TITLE_COLOR)
+        return img
+
+    @perf.timed('summary_image')
+    def render(self, summary_text, target_percentage, achievement_color):
+        img_width, img_height = IMAGE_SIZE
+        img = self.template.copy()
+        draw = ImageDraw.Draw(img)
+        _, font_body, font_bold = self.fonts
+
+        # Add the summary content with proper spacing
+        margin_top = 60
+        draw.text((20, margin_top), summary_text, font=font_body, fill="black")
+
+        # Add a colored background for target achievement status
+        draw.rectangle([20, img_height - 70, img_width - 20, img_height - 20], fill=achievement_color)
+
+        # Add the target achievement text at the bottom, with bolded percentage
+        target_text = f"Target Achievement: {target_percentage:.2f}%"
+        draw.text((20, img_height - 60), target_text, font=font_bold, fill="white")
+
+        return img
+
+    def encode(self, img):
+        # The buffer is reused per thread, so callers get a bytes copy of its contents
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            buffer = self._local.buffer = io.BytesIO()
+        buffer.seek(0)
+        buffer.truncate()
+        img.save(buffer, format=self.pil_format, **self.save_options)
+        return buffer.getvalue()
+
+    def render_bytes(self, summary_text, target_percentage, achievement_color=None):
+        if achievement_color is None:
+            achievement_color = target_color(target_percentage)
+        return self.encode(self.render(summary_text, target_percentage, achievement_color))
+
+
+@lru_cache(maxsize=None)
+def get_renderer(image_format='png', quality=85, compress_level=6):
+    """Process-wide renderer per output format and compression setting."""
+    return SummaryRenderer(image_format, quality, compress_level)
+
+
+# Create a more professional and styled image of the performance summary
+def generate_professional_performance_summary_image(summary_text, target_percentage, achievement_color=None):
+    return io.BytesIO(get_renderer().render_bytes(summary_text, target_percentage, achievement_color))
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+from data_loader import _category_strings, encode_categoricals
+
+
+def test_category_strings_keeps_numeric_codes_and_missing_values():
+    # Whole-number codes read as floats because of a gap
+    strings = _category_strings(pd.Series([1.0, np.nan, 12.0]))
+    assert strings.iloc[0] == '1' and strings.iloc[2] == '12'
+    assert pd.isna(strings.iloc[1])
+    assert list(_category_strings(pd.Series([1.5, np.nan]))[:1]) == ['1.5']
+
+
+def test_encode_categoricals_keeps_numeric_codes():
+    data = pd.DataFrame({'Distributor': [1.0, np.nan, 2.0], 'RSM': ['Nil', 'Ravi', np.nan]})
+    encoded = encode_categoricals(data)
+    assert encoded['Distributor'].dtype == encoded['RSM'].dtype == 'category'
+    assert list(encoded['Distributor'].iloc[[0, 2]]) == ['1', '2']
+    assert encoded['Distributor'].isna().tolist() == [False, True, False]
+    assert encoded['RSM'].isna().tolist() == [False, False, True]
@@ -0,0 +1,127 @@
+import os
+
+import pandas as pd
+import pytest
+
+import data_loader
+from data_loader import add_derived_columns, load_snapshot
+from hierarchy import LEVELS, PATH_METRICS, HierarchyIndex, get_index
+
+ROWS = [
+    # Employee Name, Designation, ASM, RSM, Distributor, Super, CNF, Sales, Salary, Expenses, Target
+    ('Asha', 'BDM', 'Nil', 'Nil', 'Dist_1', 'Super_1', 'CNF_1', 0, 25000, 5000, 50000),
+    ('Bala', 'BDM', 'Nil', 'Ravi', 'Dist_1', 'Super_1', 'CNF_1', 120000, 25000, 5000, 50000),
+    ('Chitra', 'BDM', 'Meena', 'Ravi', 'Dist_1', 'Super_1', 'CNF_1', 80000, 25000, 4000, 60000),
+    ('Dev', 'BDM', 'Nil', 'Sunil', 'Dist_2', 'Super_1', 'CNF_1', 45000, 20000, 3000, 40000),
+    ('Esha', 'ASM', 'Nil', 'Sunil', 'Dist_2', 'Super_1', 'CNF_1', 30000, 30000, 2000, 40000),
+    ('Esha', 'BDM', 'Nil', 'Sunil', 'Dist_2', 'Super_1', 'CNF_1', 10000, 30000, 2000, 40000),
+]
+COLUMNS = ['Employee Name', 'Designation', 'ASM', 'RSM', 'Distributor', 'Super', 'CNF',
+           'Sales - After Closing', 'Salary', 'Additional Monthly Expenses', 'Target']
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches(monkeypatch, tmp_path):
+    monkeypatch.setattr(data_loader, '_snapshots', {})
+    monkeypatch.chdir(tmp_path)
+
+
+def make_data(rows=ROWS):
+    return add_derived_columns(pd.DataFrame(rows, columns=COLUMNS))
+
+
+def summary(index):
+    # Everything an index exposes, in a comparable form
+    nodes = {
+        key: (tuple(round(float(getattr(node, metric)), 6) for metric in PATH_METRICS),
+              node.employees, node.parent, frozenset(node.children))
+        for key, node in index.nodes.items()
+    }
+    levels = {level: set(index.keys(level)) for level in LEVELS}
+    employees = {name: index.employee_metrics(name) for name in index.employee_names}
+    links = {(row.source_level, row.source, row.target_level, row.target): (row.employees, round(row.sales, 6))
+             for row in index.links.itertuples(index=False)}
+    descendants = {key: index.descendants[key] for key in index.nodes}
+    return nodes, levels, employees, links, descendants
+
+
+def changed_data():
+    data = make_data()
+    removed = data.iloc[[1, 3, 4, 5]]
+    rows = list(ROWS)
+    rows[1] = ('Bala', 'BDM', 'Nil', 'Ravi', 'Dist_1', 'Super_1', 'CNF_1', 150000, 25000, 5000, 50000)
+    rows[3] = ('Dev', 'BDM', 'Nil', 'Ravi', 'Dist_1', 'Super_1', 'CNF_1', 45000, 20000, 3000, 40000)
+    del rows[4:6]
+    rows.append(('Farah', 'BDM', 'Nil', 'Tara', 'Dist_3', 'Super_2', 'CNF_1', 60000, 22000, 2500, 50000))
+    new_data = make_data(rows)
+    added = new_data[new_data['Employee Name'].isin(['Bala', 'Dev', 'Farah'])]
+    return data, new_data, removed, added
+
+
+def test_apply_delta_matches_rebuild():
+    data, new_data, removed, added = changed_data()
+    index = HierarchyIndex(data)
+    assert summary(index.apply_delta(removed, added)) == summary(HierarchyIndex(new_data))
+
+
+def test_apply_delta_leaves_previous_index_untouched():
+    data, _, removed, added = changed_data()
+    index = HierarchyIndex(data)
+    before = summary(index)
+    updated = index.apply_delta(removed, added)
+    assert summary(index) == before
+    # Dist_2 lost its last rows in the update
+    assert ('Distributor', ('CNF_1', 'Super_1', 'Dist_2')) in index.nodes
+    assert ('Distributor', ('CNF_1', 'Super_1', 'Dist_2')) not in updated.nodes
+
+
+def test_shared_names_stay_separate_nodes():
+    index = HierarchyIndex(make_data())
+    asm_nil = [key for key in index.keys('ASM') if key[1][-1] == 'Nil']
+    assert len(asm_nil) == 3
+    bala = ('Employee Name', ('CNF_1', 'Super_1', 'Dist_1', 'Ravi', 'Nil', 'Bala'))
+    assert [key[1][-1] for key in index.ancestors(bala)] == ['CNF_1', 'Super_1', 'Dist_1', 'Ravi', 'Nil']
+    ravi = ('RSM', ('CNF_1', 'Super_1', 'Dist_1', 'Ravi'))
+    team = {key[1][-1] for key in index.descendants[ravi] if key[0] == LEVELS[-1]}
+    assert team == {'Bala', 'Chitra'}
+
+
+def test_get_index_after_file_change_matches_rebuild(tmp_path):
+    data, new_data, _, _ = changed_data()
+    path = os.path.join(tmp_path, 'data.csv')
+    data[COLUMNS].to_csv(path, index=False)
+    get_index(load_snapshot(path))
+
+    new_data[COLUMNS].to_csv(path, index=False)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    snapshot = load_snapshot(path)
+    assert snapshot.delta is not None
+    assert summary(get_index(snapshot)) == summary(HierarchyIndex(snapshot.data))
+
+
+def test_get_index_after_file_change_with_numeric_codes(tmp_path):
+    # Distributor codes read back as integers; the delta must still only hold the edited row
+    rows = [row[:4] + (number,) + row[5:] for row, number in zip(ROWS, [1, 1, 1, 2, 2, 2])]
+    path = os.path.join(tmp_path, 'data.csv')
+    make_data(rows)[COLUMNS].to_csv(path, index=False)
+    get_index(load_snapshot(path))
+
+    rows[2] = rows[2][:7] + (90000,) + rows[2][8:]
+    make_data(rows)[COLUMNS].to_csv(path, index=False)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    snapshot = load_snapshot(path)
+    assert list(snapshot.delta.added['Employee Name']) == ['Chitra']
+    assert len(snapshot.delta.removed) == 1
+    assert ('Distributor', ('CNF_1', 'Super_1', '1')) in get_index(snapshot).nodes
+    assert summary(get_index(snapshot)) == summary(HierarchyIndex(snapshot.data))
+
+
+def test_indexes_of_two_sources_are_kept_side_by_side(tmp_path):
+    paths = [os.path.join(tmp_path, name) for name in ('a.csv', 'b.csv')]
+    for path, rows in zip(paths, (ROWS, ROWS[:3])):
+        make_data(rows)[COLUMNS].to_csv(path, index=False)
+    first = [get_index(load_snapshot(path)) for path in paths]
+    assert [get_index(load_snapshot(path)) for path in paths] == first
+    assert first[0] is not first[1]
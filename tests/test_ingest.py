@@ -0,0 +1,56 @@
+import pandas as pd
+import pytest
+
+import ingest
+from ingest import HIERARCHY_COLUMNS, KEY_COLUMNS, LAST_COLUMNS, SUM_COLUMNS, ingest_csv
+
+CATEGORICAL = HIERARCHY_COLUMNS + ['Assigned State']
+
+EMPLOYEES = [
+    # Employee Name, Designation, ASM, RSM, Distributor, Super, CNF, Assigned City, Assigned State
+    ('Asha', 'BDM', 'Nil', 'Ravi', 'Dist_1', 'Super_1', 'CNF_1', 'Delhi', 'Delhi'),
+    ('Bala', 'BDM', 'Meena', 'Ravi', 'Dist_1', 'Super_1', 'CNF_1', 'Noida', 'Uttar Pradesh'),
+    # Only appears in the last chunk, with hierarchy and state values not seen before
+    ('Chitra', 'BDM', 'Nil', 'Sunil', 'Dist_2', 'Super_2', 'CNF_2', 'Pune', 'Maharashtra'),
+]
+
+
+@pytest.fixture
+def transactions(tmp_path):
+    rows = []
+    for number in range(20):
+        employee = EMPLOYEES[number % 2] if number < 18 else EMPLOYEES[2]
+        rows.append(employee + (1000.0 * (number + 1), 25000.0, 5000.0 + number, 50000.0))
+    frame = pd.DataFrame(rows, columns=KEY_COLUMNS + SUM_COLUMNS + LAST_COLUMNS)
+    path = tmp_path / 'transactions.csv'
+    frame.to_csv(path, index=False)
+    return path, frame
+
+
+def test_chunked_ingest_matches_single_pass(monkeypatch, transactions):
+    # Fold every two chunks, so both the running table and the batches are exercised
+    monkeypatch.setattr(ingest, 'FOLD_BATCH', 2)
+    aggregated = []
+    aggregate = ingest._aggregate
+
+    def recording_aggregate(frame, keys):
+        aggregated.append({column: frame[column].dtype for column in CATEGORICAL})
+        return aggregate(frame, keys)
+
+    monkeypatch.setattr(ingest, '_aggregate', recording_aggregate)
+    path, frame = transactions
+    table, stats = ingest_csv(path, chunksize=3)
+    assert stats['chunks'] == 7 and stats['rows'] == 20
+
+    # One aggregation per chunk plus one per batch of two partials
+    assert len(aggregated) == 7 + 4
+    # The folded frames stay categorical even when a later chunk brings new categories
+    assert all(dtype == 'category' for dtypes in aggregated for dtype in dtypes.values())
+
+    for column in CATEGORICAL:
+        assert table[column].dtype == 'category', column
+    expected = frame.groupby('Employee Name').agg({'Sales - After Closing': 'sum', 'Additional Monthly Expenses': 'last'})
+    result = table.set_index('Employee Name').astype({'CNF': str})
+    assert result.loc['Chitra', 'CNF'] == 'CNF_2'
+    assert result['Sales - After Closing'].to_dict() == expected['Sales - After Closing'].to_dict()
+    assert result['Additional Monthly Expenses'].to_dict() == expected['Additional Monthly Expenses'].to_dict()
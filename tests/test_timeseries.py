@@ -0,0 +1,32 @@
+import os
+
+import pandas as pd
+
+from timeseries import read_store, store_periods, sync_store
+
+COLUMNS = ['Employee Name', 'Sales - After Closing']
+
+
+def test_sync_store_drops_periods_missing_from_source(tmp_path):
+    source, store = tmp_path / 'monthly', str(tmp_path / 'store')
+    source.mkdir()
+    for month in ('2024-01', '2024-02', '2024-03'):
+        pd.DataFrame([('Asha', 1000)], columns=COLUMNS).to_csv(source / f'{month}.csv', index=False)
+    assert sync_store(str(source), store) == ['2024-01', '2024-02', '2024-03']
+
+    os.remove(source / '2024-02.csv')
+    assert sync_store(str(source), store) == []
+    assert [str(period) for period in store_periods(store)] == ['2024-01', '2024-03']
+    assert sorted(read_store(store)['Period'].astype(str)) == ['2024-01', '2024-03']
+
+
+def test_sync_store_drops_periods_gone_from_table(tmp_path):
+    table, store = tmp_path / 'sales.csv', str(tmp_path / 'store')
+    frame = pd.DataFrame([('Asha', 1000, '2024-01'), ('Asha', 2000, '2024-02')], columns=COLUMNS + ['Period'])
+    frame.to_csv(table, index=False)
+    sync_store(str(table), store)
+
+    frame.iloc[[1]].to_csv(table, index=False)
+    assert sync_store(str(table), store) == []
+    assert [str(period) for period in store_periods(store)] == ['2024-02']
+    assert read_store(store)['Sales - After Closing'].tolist() == [2000]
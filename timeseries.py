@@ -0,0 +1,251 @@
+"""Multi-period sales: a partitioned Parquet store and period-over-period trends.
+
+Monthly files (``2024-01.csv``, ``2024-02.csv``, ...) or one table with a
+period column are loaded into a store partitioned by period; only changed
+months are rewritten::
+
+    python timeseries.py monthly_exports/ --store period_store
+    python timeseries.py sales_by_month.parquet --store period_store --period-column Period
+    python timeseries.py --store period_store --latest data.csv
+
+Trends (MoM/YoY growth, rolling average sales and cumulative target
+achievement) are computed for every employee and hierarchy node at once on
+a keys-by-periods matrix.
+"""
+import argparse
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+import perf
+from data_loader import file_digest, read_source
+from hierarchy import LEVELS
+from memo import LatestCache
+
+PERIOD_COLUMN = 'Period'
+PERIOD_FREQ = 'M'
+MANIFEST = '_manifest.json'
+TIMESERIES_STORE = os.environ.get('TIMESERIES_STORE', 'period_store')
+ROLLING_PERIODS = 3
+
+_trends = LatestCache()
+
+
+def _read_manifest(store):
+    try:
+        with open(os.path.join(store, MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_partition(store, period, frame):
+    # Replace the whole partition directory so a rewritten month never keeps stale files
+    partition = os.path.join(store, f'{PERIOD_COLUMN}={period}')
+    shutil.rmtree(partition, ignore_errors=True)
+    os.makedirs(partition)
+    frame.drop(columns=[PERIOD_COLUMN], errors='ignore').to_parquet(os.path.join(partition, 'part-0.parquet'), index=False)
+
+
+def sync_store(source, store=TIMESERIES_STORE, period_column=None):
+    """Load ``source`` into the partitioned ``store``, rewriting only changed periods.
+
+    ``source`` is a directory of per-period files named after their period
+    (``2024-01.csv``), or a single table whose ``period_column`` holds the
+    period. Periods no longer in ``source`` are dropped from the store.
+    Returns the periods that were (re)written.
+    """
+    os.makedirs(store, exist_ok=True)
+    manifest = _read_manifest(store)
+    written = []
+    current = set()
+
+    if os.path.isdir(source):
+        for filename in sorted(os.listdir(source)):
+            stem, extension = os.path.splitext(filename)
+            if extension.lower() not in ('.csv', '.parquet'):
+                continue
+            path = os.path.join(source, filename)
+            period = str(pd.Period(stem, freq=PERIOD_FREQ))
+            current.add(period)
+            digest = file_digest(path)
+            if manifest.get(period) != digest:
+                _write_partition(store, period, read_source(path))
+                manifest[period] = digest
+                written.append(period)
+    else:
+        table = read_source(source)
+        periods = table[period_column or PERIOD_COLUMN].map(lambda value: str(pd.Period(value, freq=PERIOD_FREQ)))
+        hashes = pd.util.hash_pandas_object(table, index=False)
+        for period, positions in table.groupby(periods, sort=True).indices.items():
+            current.add(period)
+            # Per-period content hash, so an unchanged month in a re-exported table is skipped
+            digest = f'{int(hashes.iloc[positions].sum()) & (2**64 - 1):016x}-{len(positions)}'
+            if manifest.get(period) != digest:
+                _write_partition(store, period, table.iloc[positions].drop(columns=[period_column or PERIOD_COLUMN]))
+                manifest[period] = digest
+                written.append(period)
+
+    # Deleted monthly files, or months gone from the table, must not linger in the trends
+    for period in set(manifest) - current:
+        shutil.rmtree(os.path.join(store, f'{PERIOD_COLUMN}={period}'), ignore_errors=True)
+        del manifest[period]
+
+    with open(os.path.join(store, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return written
+
+
+def read_store(store=TIMESERIES_STORE, periods=None, columns=None):
+    """Rows of the store (optionally only ``periods``) with a ``Period`` column."""
+    filters = [(PERIOD_COLUMN, 'in', [str(period) for period in periods])] if periods else None
+    data = pd.read_parquet(store, columns=columns, filters=filters)
+    data[PERIOD_COLUMN] = pd.PeriodIndex(data[PERIOD_COLUMN].astype(str), freq=PERIOD_FREQ)
+    return data
+
+
+def store_periods(store=TIMESERIES_STORE):
+    return sorted(pd.Period(period, freq=PERIOD_FREQ) for period in _read_manifest(store))
+
+
+def latest_period_table(store=TIMESERIES_STORE):
+    # The most recent month in data.csv's layout, for the single-period apps
+    latest = store_periods(store)[-1]
+    return read_store(store, [latest]).drop(columns=[PERIOD_COLUMN])
+
+
+def period_trends(sales, target, rolling=ROLLING_PERIODS):
+    """Trend metrics from keys-by-periods ``sales`` and ``target`` matrices.
+
+    Missing periods count as zero sales. Growth is NaN where the earlier
+    period had no sales.
+    """
+    periods = pd.period_range(sales.columns.min(), sales.columns.max(), freq=PERIOD_FREQ)
+    sales = sales.reindex(columns=periods, fill_value=0.0)
+    target = target.reindex(columns=periods, fill_value=0.0)
+
+    values = sales.to_numpy(dtype=float)
+
+    def growth(lag):
+        previous = np.full_like(values, np.nan)
+        if lag < values.shape[1]:
+            previous[:, lag:] = values[:, :-lag]
+        return np.where(previous > 0, (values - previous) / previous * 100, np.nan)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mom_growth, yoy_growth = growth(1), growth(12)
+        cumulative_target = target.to_numpy(dtype=float).cumsum(axis=1)
+        cumulative_achievement = np.where(cumulative_target > 0, values.cumsum(axis=1) / cumulative_target * 100, 0.0)
+
+    # Cumulative sums give the rolling mean over the trailing window in one pass
+    cumulative_sales = np.cumsum(np.pad(values, ((0, 0), (1, 0))), axis=1)
+    window = np.minimum(np.arange(1, values.shape[1] + 1), rolling)
+    rolling_sales = (cumulative_sales[:, 1:] - cumulative_sales[:, np.arange(values.shape[1]) + 1 - window]) / window
+
+    matrices = {
+        'sales': values,
+        'target': target.to_numpy(dtype=float),
+        'mom_growth': mom_growth,
+        'yoy_growth': yoy_growth,
+        'rolling_sales': rolling_sales,
+        'cumulative_achievement': cumulative_achievement,
+    }
+    # Keys may be a MultiIndex (node paths); each key repeats once per period
+    keys = sales.index.repeat(len(periods))
+    index = pd.MultiIndex.from_arrays(
+        [keys.get_level_values(level) for level in range(keys.nlevels)] + [np.tile(periods, len(sales))],
+        names=list(sales.index.names) + [PERIOD_COLUMN],
+    )
+    return pd.DataFrame({name: matrix.ravel() for name, matrix in matrices.items()}, index=index)
+
+
+class TrendIndex:
+    """Trend metrics per employee and per hierarchy node, for every period of a store.
+
+    Hierarchy nodes are identified by their path from the CNF down (as in
+    ``HierarchyIndex``) and sum their rows' targets; employees by name, using
+    their average target across rows (as in ``HierarchyIndex.employee_metrics``).
+    """
+
+    def __init__(self, data, rolling=ROLLING_PERIODS):
+        self.periods = sorted(data[PERIOD_COLUMN].unique())
+        self.levels = {}
+        for depth, level in enumerate(LEVELS):
+            keys = [level] if level == LEVELS[-1] else LEVELS[:depth + 1]
+            grouped = data.groupby(keys + [PERIOD_COLUMN], observed=True)
+            sales = grouped['Sales - After Closing'].sum().unstack(PERIOD_COLUMN, fill_value=0.0)
+            target = grouped['Target'].mean() if level == LEVELS[-1] else grouped['Target'].sum()
+            target = target.unstack(PERIOD_COLUMN, fill_value=0.0)
+            self.levels[level] = period_trends(sales, target, rolling)
+
+    @staticmethod
+    def _key(level, node):
+        # Node path for hierarchy levels, name for employees
+        return (node,) if level == LEVELS[-1] else tuple(node)
+
+    def history(self, level, node):
+        key = self._key(level, node)
+        return self.levels[level].xs(key, level=list(range(len(key))))
+
+    def latest(self, level, node):
+        # Trend metrics for the most recent period, or None if the node is unknown
+        frame = self.levels[level]
+        key = self._key(level, node) + (frame.index.levels[-1][-1],)
+        if key not in frame.index:
+            return None
+        return frame.loc[key].to_dict()
+
+    def latest_frame(self, level):
+        frame = self.levels[level]
+        return frame.xs(frame.index.levels[-1][-1], level=PERIOD_COLUMN)
+
+
+def format_trend(trend):
+    """Short trend note for chart labels and summaries, e.g. ``MoM +4.2% · 3-mo avg ₹1,200.00``."""
+    if not trend:
+        return ''
+    parts = []
+    if not np.isnan(trend['mom_growth']):
+        parts.append(f"MoM {trend['mom_growth']:+.1f}%")
+    if not np.isnan(trend['yoy_growth']):
+        parts.append(f"YoY {trend['yoy_growth']:+.1f}%")
+    parts.append(f"{ROLLING_PERIODS}-mo avg ₹{trend['rolling_sales']:,.2f}")
+    return ' · '.join(parts)
+
+
+@perf.timed('trends')
+def get_trends(store=TIMESERIES_STORE):
+    """Trend index for ``store``, rebuilt only when its manifest changes; None without a store."""
+    manifest = _read_manifest(store)
+    if not manifest:
+        return None
+    columns = LEVELS + ['Sales - After Closing', 'Target', PERIOD_COLUMN]
+    return _trends.get(os.path.abspath(store), json.dumps(manifest, sort_keys=True),
+                       lambda previous: TrendIndex(read_store(store, columns=columns)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain the per-period sales store.")
+    parser.add_argument('source', nargs='?', help="Directory of per-period files, or a table with a period column")
+    parser.add_argument('--store', default=TIMESERIES_STORE, help="Partitioned store directory (default: %(default)s)")
+    parser.add_argument('--period-column', help=f"Period column of a single source table (default: {PERIOD_COLUMN})")
+    parser.add_argument('--latest', help="Also write the most recent period to this .csv/.parquet file")
+    args = parser.parse_args(argv)
+
+    if args.source:
+        written = sync_store(args.source, args.store, args.period_column)
+        print(f"Wrote {len(written)} period(s) to {args.store}: {', '.join(written) or 'none changed'}")
+    if args.latest:
+        table = latest_period_table(args.store)
+        if args.latest.lower().endswith('.parquet'):
+            table.to_parquet(args.latest, index=False)
+        else:
+            table.to_csv(args.latest, index=False)
+        print(f"Wrote {len(table):,} rows for {store_periods(args.store)[-1]} to {args.latest}")
+
+
+if __name__ == '__main__':
+    main()